@@ -255,6 +255,40 @@ function getColor(amplitude) {
     }
 }
 
+// Binary spectrum frames from python-fcc-detector.py (little-endian):
+// "SPEC" | uint32 bins | uint32 violations JSON length | uint32 reserved |
+// float64 start Hz | float64 step Hz | float64 timestamp | float32 amplitudes | violations JSON
+const SPECTRUM_HEADER_BYTES = 40;
+
+function isSpectrumFrame(buffer) {
+    if (buffer.byteLength < SPECTRUM_HEADER_BYTES) return false;
+    const magic = new Uint8Array(buffer, 0, 4);
+    return magic[0] === 0x53 && magic[1] === 0x50 && magic[2] === 0x45 && magic[3] === 0x43; // "SPEC"
+}
+
+function decodeSpectrumFrame(buffer) {
+    const view = new DataView(buffer);
+    const bins = view.getUint32(4, true);
+    const violationsLength = view.getUint32(8, true);
+    const startHz = view.getFloat64(16, true);
+    const stepHz = view.getFloat64(24, true);
+    
+    const freqs = new Float64Array(bins);
+    for (let i = 0; i < bins; i++) {
+        freqs[i] = startHz + i * stepHz;
+    }
+    
+    const violationsOffset = SPECTRUM_HEADER_BYTES + bins * 4;
+    return {
+        freqs: freqs,
+        amplitudes: new Float32Array(buffer, SPECTRUM_HEADER_BYTES, bins),
+        timestamp: view.getFloat64(32, true),
+        violations: violationsLength
+            ? JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, violationsOffset, violationsLength)))
+            : []
+    };
+}
+
 // WebSocket connection
 let socket;
 let reconnectAttempts = 0;
@@ -272,11 +306,17 @@ function connectWebSocket() {
         try {
             let rawData = event.data;
             if (rawData instanceof Blob) {
-                rawData = await new Response(rawData).text();
-            } else if (rawData instanceof ArrayBuffer) {
-                rawData = new TextDecoder().decode(rawData);
+                rawData = await rawData.arrayBuffer();
+            }
+            let data;
+            if (rawData instanceof ArrayBuffer && isSpectrumFrame(rawData)) {
+                data = decodeSpectrumFrame(rawData);
+            } else {
+                if (rawData instanceof ArrayBuffer) {
+                    rawData = new TextDecoder().decode(rawData);
+                }
+                data = JSON.parse(rawData.replace(/'/g, '"'));
             }
-            const data = JSON.parse(rawData.replace(/'/g, '"'));
             
             const freqs = data.freqs;
             const amplitudes = data.amplitudes;
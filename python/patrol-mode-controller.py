@@ -36,6 +36,30 @@ OPERATION_MODES = {
     'STANDBY': 'Standing by for assignment'
 }
 
+# Reusable flight modes
+GUIDED_MODE = VehicleMode("GUIDED")
+LAND_MODE = VehicleMode("LAND")
+
+# Geometry constants
+EARTH_RADIUS_M = 6371000.0
+DEG2RAD = math.pi / 180.0
+
+# Half-width of the collision pre-filter box in degrees of latitude (~110 m)
+COLLISION_BBOX_DEG = 0.001
+
+def _projector(lat0_rad):
+    """Return (kx, ky) meters-per-radian scale factors for a local equirectangular projection at lat0"""
+    return (EARTH_RADIUS_M * math.cos(lat0_rad), EARTH_RADIUS_M)
+
+def _haversine_m(lat, lon, lats, lons):
+    """Great-circle distance in meters from one point to arrays of points"""
+    lat1 = math.radians(lat)
+    lat2 = np.radians(lats)
+    dlat = lat2 - lat1
+    dlon = np.radians(lons) - math.radians(lon)
+    a = np.sin(dlat / 2) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a))
+
 def setup_environment():
     """Set up environment variables for reliable SDR library operation"""
     # Add library paths for SDR libraries
@@ -103,8 +127,19 @@ class DronePatrolController:
         setup_environment()
         
         self.config = self._load_config(config_file)
+        
+        # Home target and announcement never change, so build them once
+        home = self.config['home_location']
+        self._home_target = LocationGlobalRelative(home[0], home[1], home[2])
+        self._home_location_msg = {
+            "latitude": home[0],
+            "longitude": home[1],
+            "altitude": home[2]
+        }
+        
         self.vehicle = None
         self.websocket = None
+        self._outbound = None  # Queue drained by _writer_loop once the WebSocket is up
         self.sdr_data = {}
         
         # Patrol state
@@ -120,10 +155,14 @@ class DronePatrolController:
         # Pursuit state
         self.pursuit_target = None
         self.pursuit_frequency = None
+        self._pursuit_freq_key = None
         
         # Drone swarm info
         self.drone_id = self.config['drone_id']
-        self.other_drones = {}
+        self.other_drones = {}  # Per-drone metadata from the latest drone_status message
+        self._other_ids = []  # Row index -> drone ID for _other_pos
+        self._other_id_to_idx = {}
+        self._other_pos = np.empty((8, 3))  # (lat, lon, alt) rows; only the first len(_other_ids) are valid
         self.known_signals = {}
         self.known_violations = {}
         
@@ -217,7 +256,7 @@ class DronePatrolController:
                 await asyncio.sleep(1)
             
             # Set mode to GUIDED
-            self.vehicle.mode = VehicleMode("GUIDED")
+            self.vehicle.mode = GUIDED_MODE
             logger.info("Drone ready for patrol mission")
             return True
         except Exception as e:
@@ -313,7 +352,7 @@ class DronePatrolController:
             }
             
             if self.websocket:
-                await self.websocket.send(json.dumps(status_update))
+                await self._send_message(status_update)
             
             return True
         except Exception as e:
@@ -373,7 +412,7 @@ class DronePatrolController:
                 "waypoints": self.patrol_waypoints,
                 "timestamp": time.time()
             }
-            await self.websocket.send(json.dumps(route_msg))
+            await self._send_message(route_msg)
     
     async def generate_grid_patrol(self):
         """Generate a grid pattern patrol route"""
@@ -423,14 +462,18 @@ class DronePatrolController:
         num_points = 50  # Number of points in spiral
         spiral_loops = 3  # Number of loops in spiral
         
+        _sin = math.sin
+        _cos = math.cos
+        lon_scale = 111000 * _cos(math.radians(center_lat))  # Adjust for latitude
+        
         for i in range(num_points):
             # Parametric spiral formula
             t = i / num_points * spiral_loops * 2 * math.pi
             radius = max_distance * i / num_points
             
             # Calculate lat/lon offset
-            lat_offset = radius * math.cos(t) / 111000  # 1 deg lat = ~111km
-            lon_offset = radius * math.sin(t) / (111000 * math.cos(math.radians(center_lat)))  # Adjust for latitude
+            lat_offset = radius * _cos(t) / 111000  # 1 deg lat = ~111km
+            lon_offset = radius * _sin(t) / lon_scale
             
             # Add waypoint
             lat = center_lat + lat_offset
@@ -511,6 +554,10 @@ class DronePatrolController:
         optimized_route = [self.patrol_waypoints[0]]
         remaining = self.patrol_waypoints[1:]
         
+        # All points lie within one zone, so a single projection at the zone center is sufficient
+        kx, ky = _projector(math.radians(center_lat))
+        _hypot = math.hypot
+        
         while remaining:
             last = optimized_route[-1]
             
@@ -519,7 +566,7 @@ class DronePatrolController:
             closest_dist = float('inf')
             
             for i, point in enumerate(remaining):
-                dist = haversine((last[0], last[1]), (point[0], point[1]), unit='m')
+                dist = _hypot((point[1] - last[1]) * DEG2RAD * kx, (point[0] - last[0]) * DEG2RAD * ky)
                 if dist < closest_dist:
                     closest_dist = dist
                     closest_idx = i
@@ -538,6 +585,9 @@ class DronePatrolController:
         try:
             logger.info("Starting patrol loop")
             
+            _hypot = math.hypot
+            _rad = math.radians
+            
             while self.current_mode == 'PATROL':
                 # Get next waypoint
                 if self.current_waypoint_index >= len(self.patrol_waypoints):
@@ -578,7 +628,11 @@ class DronePatrolController:
                         self.vehicle.location.global_frame.lon
                     )
                     
-                    distance = haversine(current_loc, waypoint, unit='m')
+                    kx, ky = _projector(_rad(current_loc[0]))
+                    distance = _hypot(
+                        (waypoint[1] - current_loc[1]) * DEG2RAD * kx,
+                        (waypoint[0] - current_loc[0]) * DEG2RAD * ky
+                    )
                     
                     if distance < self.config['patrol'].get('waypoint_radius', 10):
                         reached = True
@@ -597,7 +651,7 @@ class DronePatrolController:
                                 },
                                 "timestamp": time.time()
                             }
-                            await self.websocket.send(json.dumps(visit_msg))
+                            await self._send_message(visit_msg)
                         
                         break
                     
@@ -705,7 +759,7 @@ class DronePatrolController:
                     "signal": signal,
                     "timestamp": time.time()
                 }
-                await self.websocket.send(json.dumps(signal_msg))
+                await self._send_message(signal_msg)
         else:
             # Update existing signal
             self.known_signals[freq_key].update(signal)
@@ -741,7 +795,7 @@ class DronePatrolController:
                     "violation": violation,
                     "timestamp": time.time()
                 }
-                await self.websocket.send(json.dumps(violation_msg))
+                await self._send_message(violation_msg)
             
             # Check if we should switch to pursuit mode
             if self.current_mode == 'PATROL':
@@ -773,6 +827,7 @@ class DronePatrolController:
             violation['location']['longitude']
         )
         self.pursuit_frequency = violation['frequency']
+        self._pursuit_freq_key = f"{self.pursuit_frequency / 1e6:.3f}"
         
         # Change mode
         self.current_mode = 'PURSUIT'
@@ -785,7 +840,7 @@ class DronePatrolController:
                 "violation": violation,
                 "timestamp": time.time()
             }
-            await self.websocket.send(json.dumps(pursuit_msg))
+            await self._send_message(pursuit_msg)
         
         # Start pursuit task
         asyncio.create_task(self.pursue_violation())
@@ -800,6 +855,9 @@ class DronePatrolController:
         try:
             logger.info(f"Pursuing violation at {self.pursuit_target}")
             
+            _hypot = math.hypot
+            _rad = math.radians
+            
             # Set higher speed for pursuit
             self.vehicle.airspeed = 1.5 * self.config['patrol'].get('patrol_speed', 5)
             
@@ -829,7 +887,13 @@ class DronePatrolController:
                     self.vehicle.location.global_frame.lon
                 )
                 
-                distance = haversine(current_loc, self.pursuit_target, unit='m')
+                # Per-tick projection constants shared by every distance check below
+                kx, ky = _projector(_rad(current_loc[0]))
+                
+                distance = _hypot(
+                    (self.pursuit_target[1] - current_loc[1]) * DEG2RAD * kx,
+                    (self.pursuit_target[0] - current_loc[0]) * DEG2RAD * ky
+                )
                 logger.info(f"Distance to target: {distance} meters")
                 
                 if distance < 50:  # Within 50m
@@ -847,14 +911,13 @@ class DronePatrolController:
                             },
                             "timestamp": time.time()
                         }
-                        await self.websocket.send(json.dumps(arrived_msg))
+                        await self._send_message(arrived_msg)
                     
                     break
                 
                 # Check for updated target location from SDR readings
-                freq_key = f"{self.pursuit_frequency / 1e6:.3f}"
-                if freq_key in self.known_violations:
-                    violation = self.known_violations[freq_key]
+                violation = self.known_violations.get(self._pursuit_freq_key)
+                if violation is not None:
                     
                     # Check if violation location has been updated recently
                     if time.time() - violation.get('timestamp', 0) < 30:  # Within last 30 seconds
@@ -864,7 +927,11 @@ class DronePatrolController:
                         )
                         
                         # If significantly different, update target
-                        if haversine(self.pursuit_target, updated_target, unit='m') > 50:
+                        update_dist = _hypot(
+                            (updated_target[1] - self.pursuit_target[1]) * DEG2RAD * kx,
+                            (updated_target[0] - self.pursuit_target[0]) * DEG2RAD * ky
+                        )
+                        if update_dist > 50:
                             logger.info(f"Updating pursuit target to {updated_target}")
                             self.pursuit_target = updated_target
                             
@@ -902,6 +969,7 @@ class DronePatrolController:
             self.current_mode = 'PATROL'
             self.pursuit_target = None
             self.pursuit_frequency = None
+            self._pursuit_freq_key = None
             
             logger.info("Returning to patrol mode")
             
@@ -912,7 +980,7 @@ class DronePatrolController:
                     "drone_id": self.drone_id,
                     "timestamp": time.time()
                 }
-                await self.websocket.send(json.dumps(patrol_msg))
+                await self._send_message(patrol_msg)
             
             # Resume patrol
             await self.start_patrol()
@@ -933,24 +1001,30 @@ class DronePatrolController:
             self.vehicle.location.global_frame.alt
         )
         
-        # Check distance to each other drone
-        for drone_id, data in self.other_drones.items():
-            if 'location' not in data:
-                continue
-            
-            drone_pos = (
-                data['location']['latitude'],
-                data['location']['longitude'],
-                data['location']['altitude']
-            )
-            
-            # Calculate horizontal and vertical distance
-            horizontal_dist = haversine(
-                (our_pos[0], our_pos[1]),
-                (drone_pos[0], drone_pos[1]),
-                unit='m'
-            )
-            vertical_dist = abs(our_pos[2] - drone_pos[2])
+        count = len(self._other_ids)
+        if not count:
+            return
+        
+        positions = self._other_pos[:count]
+        
+        # Cheap bounding-box pre-filter so the haversine check only runs for nearby drones
+        lon_bbox = COLLISION_BBOX_DEG / max(math.cos(math.radians(our_pos[0])), 1e-6)
+        nearby = np.flatnonzero(
+            (np.abs(positions[:, 0] - our_pos[0]) < COLLISION_BBOX_DEG) &
+            (np.abs(positions[:, 1] - our_pos[1]) < lon_bbox)
+        )
+        if not nearby.size:
+            return
+        
+        # Calculate horizontal and vertical distance to each nearby drone
+        candidates = positions[nearby]
+        horizontal_dists = _haversine_m(our_pos[0], our_pos[1], candidates[:, 0], candidates[:, 1])
+        vertical_dists = np.abs(our_pos[2] - candidates[:, 2])
+        
+        for idx, drone_pos, horizontal_dist, vertical_dist in zip(
+            nearby, candidates, horizontal_dists, vertical_dists
+        ):
+            drone_id = self._other_ids[idx]
             
             # Check if too close
             min_horizontal = 20  # meters
@@ -986,11 +1060,30 @@ class DronePatrolController:
                         "new_altitude": new_alt,
                         "timestamp": time.time()
                     }
-                    await self.websocket.send(json.dumps(collision_msg))
+                    await self._send_message(collision_msg)
                 
                 # Wait for altitude change
                 await asyncio.sleep(5)
     
+    def _update_other_position(self, drone_id, location):
+        """Store another drone's position in the struct-of-arrays used by collision checks"""
+        idx = self._other_id_to_idx.get(drone_id)
+        if idx is None:
+            idx = len(self._other_ids)
+            if idx == len(self._other_pos):
+                # Grow geometrically so appends stay amortized O(1)
+                grown = np.empty((2 * len(self._other_pos), 3))
+                grown[:idx] = self._other_pos
+                self._other_pos = grown
+            self._other_ids.append(drone_id)
+            self._other_id_to_idx[drone_id] = idx
+        
+        self._other_pos[idx] = (
+            location['latitude'],
+            location['longitude'],
+            location.get('altitude', np.nan)
+        )
+    
     async def send_status_update(self):
         """Send periodic status updates to server"""
         if not self.websocket or not self.vehicle:
@@ -1018,10 +1111,50 @@ class DronePatrolController:
                 "violations_detected": len(self.known_violations)
             }
             
-            await self.websocket.send(json.dumps(status))
+            await self._send_message(status)
         except Exception as e:
             logger.error(f"Error sending status update: {e}")
     
+    async def _send_message(self, message):
+        """Queue a message for the writer task, or send it directly if no writer is running"""
+        if self._outbound is not None:
+            self._outbound.put_nowait(message)
+        elif self.websocket:
+            await self.websocket.send(json.dumps(message))
+    
+    async def _writer_loop(self):
+        """Drain queued outbound messages, writing each burst back-to-back"""
+        while True:
+            batch = [await self._outbound.get()]
+            while not self._outbound.empty():
+                batch.append(self._outbound.get_nowait())
+            
+            try:
+                for payload in [json.dumps(message) for message in batch]:
+                    await self.websocket.send(payload)
+            except websockets.exceptions.ConnectionClosed:
+                logger.error("WebSocket connection closed, dropping outbound messages")
+                self._outbound = None
+                return
+            except Exception as e:
+                logger.error(f"Error sending messages: {e}")
+    
+    async def _status_loop(self, period=1.0):
+        """Send status updates at a fixed rate, correcting for time spent sending"""
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        
+        while True:
+            await self.send_status_update()
+            
+            next_tick += period
+            delay = next_tick - loop.time()
+            if delay < 0:
+                # Fell behind (e.g. slow send); resynchronize instead of bursting
+                next_tick = loop.time()
+                delay = 0
+            await asyncio.sleep(delay)
+    
     async def receive_messages(self):
         """Process incoming messages from server"""
         if not self.websocket:
@@ -1048,6 +1181,10 @@ class DronePatrolController:
                         
                         # Update drone info
                         self.other_drones[drone_id].update(data)
+                        
+                        location = data.get('location')
+                        if location:
+                            self._update_other_position(drone_id, location)
                 
                 elif msg_type == 'violation_detected':
                     # Another drone detected a violation
@@ -1061,7 +1198,8 @@ class DronePatrolController:
                     
                     # If we're also pursuing the same frequency, check if we should continue
                     if self.current_mode == 'PURSUIT' and self.pursuit_frequency:
-                        other_freq = data.get('violation', {}).get('frequency')
+                        other_violation = data.get('violation', {})
+                        other_freq = other_violation.get('frequency')
                         
                         if other_freq and abs(other_freq - self.pursuit_frequency) < 10000:  # Within 10 kHz
                             # Check distance to target
@@ -1073,18 +1211,15 @@ class DronePatrolController:
                             our_distance = haversine(our_pos, self.pursuit_target, unit='m')
                             
                             # Get other drone position
-                            if pursuing_drone in self.other_drones and 'location' in self.other_drones[pursuing_drone]:
-                                other_pos = (
-                                    self.other_drones[pursuing_drone]['location']['latitude'],
-                                    self.other_drones[pursuing_drone]['location']['longitude']
-                                )
+                            other_idx = self._other_id_to_idx.get(pursuing_drone)
+                            other_loc = other_violation.get('location')
+                            if other_idx is not None and other_loc is not None:
+                                other_pos = tuple(self._other_pos[other_idx, :2])
                                 
-                                other_target = (
-                                    data.get('violation', {}).get('location', {}).get('latitude'),
-                                    data.get('violation', {}).get('location', {}).get('longitude')
-                                )
+                                other_target = (other_loc.get('latitude'), other_loc.get('longitude'))
                                 
-                                if all(other_target):
+                                # Explicit None checks so a 0.0 latitude/longitude is not treated as missing
+                                if other_target[0] is not None and other_target[1] is not None:
                                     other_distance = haversine(other_pos, other_target, unit='m')
                                     
                                     # If other drone is closer, let them pursue and we go back to patrol
@@ -1093,6 +1228,7 @@ class DronePatrolController:
                                         self.current_mode = 'PATROL'
                                         self.pursuit_target = None
                                         self.pursuit_frequency = None
+                                        self._pursuit_freq_key = None
                                         
                                         # Resume patrol
                                         await self.start_patrol()
@@ -1203,7 +1339,7 @@ class DronePatrolController:
         
         elif cmd_type == 'land':
             logger.info("Landing by command")
-            self.vehicle.mode = VehicleMode("LAND")
+            self.vehicle.mode = LAND_MODE
     
     async def return_to_home(self):
         """Return drone to home location"""
@@ -1219,27 +1355,24 @@ class DronePatrolController:
             self.vehicle.airspeed = self.config['patrol'].get('patrol_speed', 5)
             
             # Move to home location
-            target = LocationGlobalRelative(home[0], home[1], home[2])
-            self.vehicle.simple_goto(target)
+            self.vehicle.simple_goto(self._home_target)
             
             # Notify visualization
             if self.websocket:
                 return_msg = {
                     "type": "returning_home",
                     "drone_id": self.drone_id,
-                    "home_location": {
-                        "latitude": home[0],
-                        "longitude": home[1],
-                        "altitude": home[2]
-                    },
+                    "home_location": self._home_location_msg,
                     "timestamp": time.time()
                 }
-                await self.websocket.send(json.dumps(return_msg))
+                await self._send_message(return_msg)
             
             # Track progress
             start_time = time.time()
             timeout = 300  # 5 minutes max
             arrived = False
+            _hypot = math.hypot
+            _rad = math.radians
             
             while not arrived and time.time() - start_time < timeout:
                 # Check distance to home
@@ -1248,7 +1381,11 @@ class DronePatrolController:
                     self.vehicle.location.global_frame.lon
                 )
                 
-                distance = haversine(current_loc, (home[0], home[1]), unit='m')
+                kx, ky = _projector(_rad(current_loc[0]))
+                distance = _hypot(
+                    (home[1] - current_loc[1]) * DEG2RAD * kx,
+                    (home[0] - current_loc[0]) * DEG2RAD * ky
+                )
                 
                 if distance < 10:  # Within 10m
                     arrived = True
@@ -1262,7 +1399,7 @@ class DronePatrolController:
             
             # Land
             logger.info("Landing at home location")
-            self.vehicle.mode = VehicleMode("LAND")
+            self.vehicle.mode = LAND_MODE
             
             # Wait for landing
             while self.vehicle.location.global_relative_frame.alt > 0.5:
@@ -1288,23 +1425,23 @@ class DronePatrolController:
         if not ws_connected:
             logger.warning("Failed to connect to WebSocket. Continuing without server communication.")
         
-        # Start message receiver if websocket is connected
+        # Start message receiver and status updates if websocket is connected
+        status_task = None
+        writer_task = None
         if ws_connected:
+            self._outbound = asyncio.Queue()
+            writer_task = asyncio.create_task(self._writer_loop())
             receiver_task = asyncio.create_task(self.receive_messages())
+            status_task = asyncio.create_task(self._status_loop())
         
-        # Main status loop
+        # Main lifecycle loop
         try:
             while True:
-                # Send status updates
-                if ws_connected:
-                    await self.send_status_update()
-                
                 # If in standby, wait for commands
                 if self.current_mode == 'STANDBY':
                     logger.info("Drone in standby mode. Waiting for commands.")
-                    await asyncio.sleep(5)
                 
-                await asyncio.sleep(1)
+                await asyncio.sleep(5)
         
         except asyncio.CancelledError:
             logger.info("Drone patrol controller task cancelled")
@@ -1312,6 +1449,10 @@ class DronePatrolController:
             logger.error(f"Error in main loop: {e}")
         finally:
             # Clean up
+            if status_task:
+                status_task.cancel()
+            if writer_task:
+                writer_task.cancel()
             if self.vehicle:
                 self.vehicle.close()
             if self.websocket:
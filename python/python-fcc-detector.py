@@ -1,9 +1,13 @@
 import asyncio
 import numpy as np
+import scipy.fft
+from scipy.signal import find_peaks
 import websockets
 import requests
 import json
+import struct
 import time
+from concurrent.futures import ThreadPoolExecutor
 from rtlsdr import RtlSdr
 
 # Handle optional MongoDB import
@@ -14,9 +18,53 @@ except ImportError:
     HAVE_MONGODB = False
     print("MongoDB not available - violation logging will be disabled")
 
+# Handle optional pyFFTW import
+try:
+    import pyfftw
+    HAVE_PYFFTW = True
+except ImportError:
+    HAVE_PYFFTW = False
+    print("pyFFTW not available - using scipy.fft")
+
+# Handle optional orjson import
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+    print("orjson not available - using json for WebSocket frames")
+
+# Handle optional Numba import
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+    print("Numba not available - using NumPy violation detection")
+
 import os
 import sys
 
+# Number of spectrum bins sent to clients per frame
+DISPLAY_BINS = 2048
+
+# Seconds between spectrum frames (10 Hz)
+FRAME_INTERVAL = 0.1
+
+# Random generator for the simulated stream
+rng = np.random.default_rng()
+
+# Sleep until the next frame tick on an absolute schedule, so processing time
+# doesn't stretch the frame period; if we fall a whole tick behind, resync
+# rather than sending a burst of frames to catch up
+async def wait_next_tick(loop, next_tick, interval=FRAME_INTERVAL):
+    next_tick += interval
+    now = loop.time()
+    if next_tick < now:
+        next_tick = now
+    await asyncio.sleep(next_tick - now)
+    return next_tick
+
 def setup_environment():
     """Set up environment variables for reliable SDR library operation"""
     # Add library paths for SDR libraries
@@ -52,16 +100,113 @@ def setup_mongodb():
         print("Continuing without violation logging...")
         return None
 
-# Load EIBI Database
-def load_eibi_data():
+# Materialize violation records from frequency (kHz) / power columns
+def violation_records(freq_khz, power, timestamp, **extra):
+    return [
+        {
+            "frequency_khz": f,
+            "frequency_mhz": f / 1000.0,
+            "power": p,
+            "timestamp": timestamp,
+            **extra
+        }
+        for f, p in zip(np.asarray(freq_khz).tolist(), np.asarray(power).tolist())
+    ]
+
+# Buffered violation logging: frames append columns, a background task flushes in batches
+class ViolationLog:
+    def __init__(self, collection, flush_interval=2.0, max_buffer=500):
+        self.collection = collection
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self._buffer = []  # (freq_khz, power, timestamp, extra) column chunks
+        self._pending = 0
+        self._flush_requested = asyncio.Event()
+    
+    def add(self, freq_khz, power, timestamp, **extra):
+        self._buffer.append((freq_khz, power, timestamp, extra))
+        self._pending += len(freq_khz)
+        if self._pending >= self.max_buffer:
+            self._flush_requested.set()
+    
+    def _insert(self, chunks):
+        records = []
+        for freq_khz, power, timestamp, extra in chunks:
+            records.extend(violation_records(freq_khz, power, timestamp, **extra))
+        self.collection.insert_many(records, ordered=False)
+        return len(records)
+    
+    async def flush(self):
+        if not self._buffer:
+            return
+        
+        chunks, self._buffer, self._pending = self._buffer, [], 0
+        try:
+            # Records are built and inserted off the event loop since pymongo blocks
+            loop = asyncio.get_running_loop()
+            count = await loop.run_in_executor(None, self._insert, chunks)
+            print(f"Logged {count} violations to MongoDB")
+        except Exception as e:
+            print(f"Error logging to MongoDB: {e}")
+    
+    async def run(self):
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(self._flush_requested.wait(), self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._flush_requested.clear()
+                await self.flush()
+        finally:
+            await self.flush()
+
+# Load EIBI Database with on-disk caching
+EIBI_URL = "https://www.eibispace.de/dx/freq-a.txt"  # EIBI frequency list URL
+EIBI_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "fcc", "eibi_cache.json")
+EIBI_CACHE_MAX_AGE = 7 * 24 * 3600  # Refresh weekly
+
+def _read_eibi_cache():
+    try:
+        with open(EIBI_CACHE_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _write_eibi_cache(eibi_data, etag):
+    try:
+        os.makedirs(os.path.dirname(EIBI_CACHE_FILE), exist_ok=True)
+        with open(EIBI_CACHE_FILE, 'w') as f:
+            json.dump({'timestamp': time.time(), 'etag': etag, 'data': eibi_data}, f)
+    except OSError as e:
+        print(f"Error writing EIBI cache: {e}")
+
+def load_eibi_data(force_refresh=False):
+    cache = _read_eibi_cache()
+    
+    # Use the cache outright while it is recent enough
+    if cache and not force_refresh:
+        age = time.time() - cache.get('timestamp', 0)
+        if age < EIBI_CACHE_MAX_AGE:
+            print(f"Using cached EIBI data (age: {age / 3600:.1f} hours)")
+            return cache.get('data', [])
+    
     print("Loading EIBI database...")
     try:
-        eibi_url = "https://www.eibispace.de/dx/freq-a.txt"  # EIBI frequency list URL
-        response = requests.get(eibi_url, timeout=10)
+        # Revalidate with the server so an unchanged list is not downloaded and parsed again
+        headers = {}
+        if cache and cache.get('etag') and not force_refresh:
+            headers['If-None-Match'] = cache['etag']
+        response = requests.get(EIBI_URL, headers=headers, timeout=10)
+        
+        if response.status_code == 304:
+            print("EIBI database unchanged, refreshing cache timestamp")
+            _write_eibi_cache(cache['data'], cache['etag'])
+            return cache['data']
         
         if response.status_code != 200:
             print(f"Failed to retrieve EIBI data: HTTP {response.status_code}")
-            return []
+            raise requests.RequestException(f"HTTP {response.status_code}")
         
         eibi_data = []
         for line in response.text.splitlines():
@@ -76,12 +221,34 @@ def load_eibi_data():
                     "mode": parts[4]
                 })
         
+        _write_eibi_cache(eibi_data, response.headers.get('ETag'))
         print(f"Loaded {len(eibi_data)} entries from EIBI database")
         return eibi_data
     except Exception as e:
         print(f"Error loading EIBI database: {e}")
+        
+        # Fall back to an expired cache rather than running with no database
+        if cache:
+            print("Using expired EIBI cache as fallback")
+            return cache.get('data', [])
         return []
 
+# Build a sorted array of EIBI frequencies for binary-search lookups
+def build_eibi_index(eibi_db):
+    return np.sort(np.array([entry["frequency_kHz"] for entry in eibi_db], dtype=np.float64))
+
+def eibi_distance_khz(eibi_freqs_khz, freqs_khz):
+    """Distance from each frequency to its nearest EIBI entry (inf if the database is empty)"""
+    freqs_khz = np.asarray(freqs_khz, dtype=np.float64)
+    if not len(eibi_freqs_khz):
+        return np.full(freqs_khz.shape, np.inf)
+    
+    # Nearest neighbour is either the insertion point or the entry just before it
+    ins = np.searchsorted(eibi_freqs_khz, freqs_khz)
+    right = eibi_freqs_khz[np.clip(ins, 0, len(eibi_freqs_khz) - 1)]
+    left = eibi_freqs_khz[np.clip(ins - 1, 0, len(eibi_freqs_khz) - 1)]
+    return np.minimum(np.abs(right - freqs_khz), np.abs(freqs_khz - left))
+
 # SDR Configuration
 def setup_sdr():
     try:
@@ -98,105 +265,221 @@ def setup_sdr():
         print(f"Error initializing SDR: {e}")
         return None
 
-# Detect violations by comparing with EIBI database
-def detect_violations(freqs, fft_data, eibi_db, threshold=0.3):
-    violations = []
+# FFT with plan and buffer reuse across frames
+def create_fft(num_samples):
+    """Return a function computing the complex FFT of num_samples samples.
     
-    # Convert Hz to kHz for comparison with EIBI database
-    freqs_khz = freqs / 1000.0
+    With pyFFTW the plan is measured once and its aligned buffers are reused, so the
+    returned spectrum is overwritten by the next call. Otherwise scipy.fft (pocketfft)
+    is used across all cores and may overwrite the input samples. complex64 input
+    runs in single precision on both paths.
+    """
+    if HAVE_PYFFTW:
+        in_buf = pyfftw.empty_aligned(num_samples, dtype='complex64')
+        out_buf = pyfftw.empty_aligned(num_samples, dtype='complex64')
+        fft_obj = pyfftw.FFTW(in_buf, out_buf, flags=('FFTW_MEASURE', 'FFTW_DESTROY_INPUT'))
+        
+        def fft(samples):
+            in_buf[:] = samples
+            return fft_obj()
+        
+        return fft
     
-    # Find peaks in the FFT data (potential signals)
-    peak_indices = []
-    for i in range(1, len(fft_data) - 1):
-        if fft_data[i] > threshold and fft_data[i] > fft_data[i-1] and fft_data[i] > fft_data[i+1]:
-            peak_indices.append(i)
+    return lambda samples: scipy.fft.fft(samples, workers=-1, overwrite_x=True)
+
+# Max-pool a spectrum into blocks of `factor` bins (keeps the tallest bin, so peaks survive)
+def downsample_max(data, factor):
+    if factor <= 1:
+        return data
+    usable = len(data) - len(data) % factor
+    return data[:usable].reshape(-1, factor).max(axis=1)
+
+# Scale a spectrum to a peak of 1.0 in place (one pass for the max, one for the multiply)
+def normalize_inplace(data):
+    peak = data.max()
+    if peak > 0:
+        np.multiply(data, 1.0 / peak, out=data)
+    return data
+
+# Serialize to JSON bytes, passing NumPy arrays through without .tolist() where possible
+def encode_json(data):
+    if HAVE_ORJSON:
+        return orjson.dumps(data, default=str, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, default=lambda obj: obj.tolist() if isinstance(obj, np.ndarray) else str(obj)).encode()
+
+# Binary spectrum frame layout (little-endian):
+#   b"SPEC" | uint32 bins | uint32 violations JSON length | uint32 reserved |
+#   float64 start Hz | float64 step Hz | float64 timestamp |
+#   float32 amplitudes[bins] | UTF-8 violations JSON
+# Every frame is self-describing, so clients that join mid-stream (e.g. through the
+# Node relay) can decode it without a separate header message.
+SPECTRUM_FRAME_MAGIC = b"SPEC"
+SPECTRUM_FRAME_HEADER = struct.Struct("<4sIII3d")
+
+def encode_spectrum_frame(start_hz, step_hz, amplitudes, violations, timestamp):
+    amplitudes = np.ascontiguousarray(amplitudes, dtype=np.float32)
+    violations_json = encode_json(violations) if violations else b""
+    header = SPECTRUM_FRAME_HEADER.pack(
+        SPECTRUM_FRAME_MAGIC, len(amplitudes), len(violations_json), 0, start_hz, step_hz, timestamp
+    )
+    return b"".join((header, memoryview(amplitudes).cast("B"), violations_json))
+
+# Nearest-EIBI binary search as plain loops, compiled with Numba when available
+def _eibi_unmatched(peak_khz, eibi_freqs_khz, tolerance_khz):
+    n = len(peak_khz)
+    m = len(eibi_freqs_khz)
+    unmatched = np.empty(n, dtype=np.bool_)
     
-    for idx in peak_indices:
-        freq_khz = freqs_khz[idx]
-        power = fft_data[idx]
+    for i in range(n):
+        freq = peak_khz[i]
         
-        # Look for a match in EIBI database (with some tolerance)
-        tolerance_khz = 5  # 5 kHz tolerance
-        match = None
-        
-        for entry in eibi_db:
-            if abs(entry["frequency_kHz"] - freq_khz) < tolerance_khz:
-                match = entry
-                break
+        # Binary search for the first EIBI entry >= freq
+        lo = 0
+        hi = m
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if eibi_freqs_khz[mid] < freq:
+                lo = mid + 1
+            else:
+                hi = mid
         
-        # If no match found and signal is strong, consider it a potential violation
-        if not match and power > threshold:
-            violations.append({
-                "frequency_khz": freq_khz,
-                "frequency_mhz": freq_khz / 1000.0,
-                "power": float(power),
-                "timestamp": time.time()
-            })
+        matched = (lo < m and eibi_freqs_khz[lo] - freq < tolerance_khz) or \
+                  (lo > 0 and freq - eibi_freqs_khz[lo - 1] < tolerance_khz)
+        unmatched[i] = not matched
     
-    return violations
+    return unmatched
+
+if HAVE_NUMBA:
+    _eibi_unmatched = njit(cache=True)(_eibi_unmatched)
+
+# Mark which spectrum bins lie within tolerance of an EIBI frequency. The frequency
+# axis is fixed for a stream, so this runs once and per-frame matching is a lookup.
+def build_eibi_mask(freqs_khz, eibi_freqs_khz, tolerance_khz=5.0):
+    if HAVE_NUMBA:
+        return ~_eibi_unmatched(freqs_khz, eibi_freqs_khz, tolerance_khz)
+    return eibi_distance_khz(eibi_freqs_khz, freqs_khz) < tolerance_khz
+
+# Detect violations by comparing with EIBI database
+def detect_violations(freqs_khz, fft_data, eibi_mask, threshold=0.3, min_distance_bins=1):
+    """Return (frequency_khz, power) arrays for strong peaks with no EIBI match"""
+    # Find peaks in the FFT data (potential signals); peaks closer than
+    # min_distance_bins are thinned to the tallest one
+    peak_indices, _ = find_peaks(fft_data, height=threshold, distance=max(1, min_distance_bins))
+    
+    # Look for a match in EIBI database (bins precomputed by build_eibi_mask)
+    peak_indices = peak_indices[~eibi_mask[peak_indices]]
+    
+    # Peaks with no EIBI match are potential violations, returned as (kHz, power) columns
+    return freqs_khz[peak_indices], fft_data[peak_indices]
+
+# FFT, decimation, normalization and peak detection for one hardware frame.
+# All NumPy/FFT work, so it runs on a worker thread with the GIL mostly released.
+def process_frame(fft, samples, magnitude, decimation, freqs_khz, eibi_mask, min_peak_bins):
+    # 8-bit I/Q, so single precision loses nothing
+    samples = samples.astype(np.complex64, copy=False)
+    
+    # Compute FFT and decimate to display resolution. Pooling blocks tile the
+    # two FFT halves exactly, so the shift is applied to the small pooled
+    # array instead of permuting the full-resolution spectrum.
+    np.abs(fft(samples), out=magnitude)
+    fft_data = np.fft.fftshift(downsample_max(magnitude, decimation))
+    
+    # Normalize FFT data
+    normalize_inplace(fft_data)
+    
+    # Detect violations
+    violation_khz, violation_power = detect_violations(
+        freqs_khz, fft_data, eibi_mask, min_distance_bins=min_peak_bins
+    )
+    return fft_data, violation_khz, violation_power
 
 # WebSocket handler for SDR streaming with violation detection
-async def sdr_stream_with_detection(websocket, path, eibi_db, violations_collection):
+async def sdr_stream_with_detection(websocket, path, eibi_freqs_khz, violation_log):
     print("Client connected to SDR data stream with violation detection")
     
     sdr = setup_sdr()
     if not sdr:
         # Fallback to simulation mode if SDR is not available
-        await simulate_sdr_with_detection(websocket, eibi_db, violations_collection)
+        await simulate_sdr_with_detection(websocket, eibi_freqs_khz, violation_log)
         return
     
+    # Single reader thread so the next USB read overlaps with processing of the current frame
+    read_pool = ThreadPoolExecutor(max_workers=1)
+    pending_send = None
+    
     try:
+        loop = asyncio.get_running_loop()
+        num_samples = 256 * 1024
+        fft = create_fft(num_samples)
+        
+        # Tuning is fixed for the stream, so the frequency axis is too.
+        # Clients and peak detection work on max-pooled blocks, labelled by their center frequency.
+        decimation = max(1, num_samples // DISPLAY_BINS)
+        assert (num_samples // 2) % decimation == 0, "pooling blocks must not straddle DC"
+        freqs = np.fft.fftshift(np.fft.fftfreq(num_samples, 1 / sdr.sample_rate)) + sdr.center_freq
+        usable = num_samples - num_samples % decimation
+        freqs = freqs[:usable].reshape(-1, decimation).mean(axis=1)
+        freqs_khz = freqs / 1000.0  # kHz for comparison with EIBI database
+        eibi_mask = build_eibi_mask(freqs_khz, eibi_freqs_khz)
+        freq_start, freq_step = float(freqs[0]), float(freqs[1] - freqs[0])
+        
+        # Keep detected peaks at least the 5 kHz EIBI tolerance apart
+        bin_hz = sdr.sample_rate / num_samples * decimation
+        min_peak_bins = int(5e3 / bin_hz)
+        
+        # Magnitude buffer reused across frames
+        magnitude = np.empty(num_samples, dtype=np.float32)
+        
+        pending_read = loop.run_in_executor(read_pool, sdr.read_samples, num_samples)
+        
+        next_tick = loop.time()
         while True:
-            # Read samples from SDR
-            samples = sdr.read_samples(256 * 1024)
-            
-            # Compute FFT
-            fft_data = np.fft.fftshift(np.abs(np.fft.fft(samples)))
-            freqs = np.fft.fftshift(np.fft.fftfreq(len(samples), 1 / sdr.sample_rate)) + sdr.center_freq
+            # Collect this frame's samples and immediately start reading the next frame
+            samples = await pending_read
+            pending_read = loop.run_in_executor(read_pool, sdr.read_samples, num_samples)
             
-            # Normalize FFT data
-            fft_data = fft_data / np.max(fft_data) if np.max(fft_data) > 0 else fft_data
+            # Process off the event loop, so the previous frame's send keeps going meanwhile
+            fft_data, violation_khz, violation_power = await asyncio.to_thread(
+                process_frame, fft, samples, magnitude, decimation, freqs_khz, eibi_mask, min_peak_bins
+            )
+            timestamp = time.time()
+            violations = violation_records(violation_khz, violation_power, timestamp) if len(violation_khz) else []
             
-            # Detect violations
-            violations = detect_violations(freqs, fft_data, eibi_db)
+            # Queue violations for MongoDB if available
+            if violation_log and violations:
+                violation_log.add(violation_khz, violation_power, timestamp)
             
-            # Log violations to MongoDB if available
-            if violations_collection and violations:
-                try:
-                    violations_collection.insert_many(violations)
-                    print(f"Logged {len(violations)} violations to MongoDB")
-                except Exception as e:
-                    print(f"Error logging to MongoDB: {e}")
-            
-            # Package data for WebSocket
-            data = {
-                "freqs": freqs.tolist(),
-                "amplitudes": fft_data.tolist(),
-                "violations": violations,
-                "timestamp": time.time()
-            }
-            
-            # Send to WebSocket
-            await websocket.send(json.dumps(data))
+            # Send to WebSocket as a binary frame. The send runs in the background while
+            # the next frame is computed; waiting for the previous one first keeps frames
+            # in order, and since send() waits for the transport to drain, a slow client
+            # throttles us instead of growing the buffer.
+            frame = encode_spectrum_frame(freq_start, freq_step, fft_data, violations, timestamp)
+            if pending_send is not None:
+                await pending_send
+            pending_send = asyncio.ensure_future(websocket.send(frame))
             
             # Output stats
             if violations:
                 print(f"Detected {len(violations)} potential FCC violations")
             
             # Limit update rate
-            await asyncio.sleep(0.1)
+            next_tick = await wait_next_tick(loop, next_tick)
     
     except websockets.exceptions.ConnectionClosed:
         print("Client disconnected")
     except Exception as e:
         print(f"Error in SDR stream: {e}")
     finally:
+        if pending_send is not None:
+            pending_send.cancel()
+        # Let any in-flight read finish before closing the device
+        read_pool.shutdown(wait=True)
         if sdr:
             sdr.close()
             print("SDR closed")
 
 # Fallback: Simulate SDR data with violations for testing
-async def simulate_sdr_with_detection(websocket, eibi_db, violations_collection):
+async def simulate_sdr_with_detection(websocket, eibi_freqs_khz, violation_log):
     print("FALLBACK: Using simulated SDR data with violation detection")
     
     # Configure simulated SDR parameters
@@ -204,14 +487,25 @@ async def simulate_sdr_with_detection(websocket, eibi_db, violations_collection)
     center_freq = 100e6    # 100 MHz
     
     try:
+        loop = asyncio.get_running_loop()
+        num_samples = 1024
+        freqs = np.fft.fftshift(np.fft.fftfreq(num_samples, 1 / sample_rate)) + center_freq
+        eibi_mask = build_eibi_mask(freqs / 1000.0, eibi_freqs_khz)
+        freq_start, freq_step = float(freqs[0]), float(freqs[1] - freqs[0])
+        
+        # Simulated time base and fixed 0.1 MHz carrier never change
+        t = np.arange(0, num_samples) / sample_rate
+        two_pi_t = (2 * np.pi * t).astype(np.float32)
+        base_signal = np.sin(2 * np.pi * 0.1e6 * t).astype(np.float32)
+        
+        # Per-frame buffers
+        samples = np.empty(num_samples, dtype=np.float32)
+        component = np.empty(num_samples, dtype=np.float32)
+        
         sample_count = 0
+        next_tick = loop.time()
         while True:
-            # Create simulated time base
             sample_count += 1
-            t = np.arange(0, 1024) / sample_rate
-            
-            # Generate simulated signals
-            base_signal = np.sin(2 * np.pi * 0.1e6 * t)
             
             # Add some dynamic frequency components
             f1 = 0.2e6 + 0.05e6 * np.sin(sample_count / 50)
@@ -219,26 +513,33 @@ async def simulate_sdr_with_detection(websocket, eibi_db, violations_collection)
             
             # Add noise
             noise_level = 0.1 + 0.05 * np.sin(sample_count / 20)
-            noise = np.random.normal(0, noise_level, len(t))
+            noise = np.random.normal(0, noise_level, num_samples)
             
-            # Combine signals
-            samples = base_signal + 0.7 * np.sin(2 * np.pi * f1 * t) + 0.5 * np.sin(2 * np.pi * f2 * t) + noise
+            # Combine signals: base + 0.7*sin(2*pi*f1*t) + 0.5*sin(2*pi*f2*t) + noise
+            np.add(base_signal, noise, out=samples)
+            for freq, amplitude in ((f1, 0.7), (f2, 0.5)):
+                np.multiply(two_pi_t, freq, out=component)
+                np.sin(component, out=component)
+                component *= amplitude
+                samples += component
             
-            # Compute FFT
-            fft_data = np.fft.fftshift(np.abs(np.fft.fft(samples)))
-            freqs = np.fft.fftshift(np.fft.fftfreq(len(samples), 1 / sample_rate)) + center_freq
+            # Compute FFT in single precision
+            fft_data = np.fft.fftshift(np.abs(scipy.fft.fft(samples)))
             
             # Normalize
-            fft_data = fft_data / np.max(fft_data)
+            normalize_inplace(fft_data)
             
-            # Introduce some random peaks to simulate signals
-            for _ in range(3):
-                if np.random.random() < 0.1:  # 10% chance of a new peak
-                    idx = np.random.randint(0, len(fft_data))
-                    fft_data[idx-5:idx+5] += np.random.random() * 0.5
+            # Introduce some random peaks to simulate signals: 3 candidates, 10% chance each,
+            # each raising a 10-bin window kept clear of the array edges
+            num_peaks = int((rng.random(3) < 0.1).sum())
+            if num_peaks:
+                peak_idx = rng.integers(5, len(fft_data) - 5, size=num_peaks)
+                peak_amp = rng.random(num_peaks) * 0.5
+                window = (peak_idx[:, None] + np.arange(-5, 5)).ravel()
+                np.add.at(fft_data, window, np.repeat(peak_amp, 10))
             
             # Re-normalize after adding peaks
-            fft_data = fft_data / np.max(fft_data)
+            normalize_inplace(fft_data)
             
             # Add simulated violations randomly
             simulated_violations = []
@@ -247,44 +548,26 @@ async def simulate_sdr_with_detection(websocket, eibi_db, violations_collection)
                 violation_freq = freqs[violation_idx] / 1000.0  # Convert to kHz
                 
                 # Make sure this frequency is not in EIBI database (truly a violation)
-                is_violation = True
-                for entry in eibi_db:
-                    if abs(entry["frequency_kHz"] - violation_freq) < 5:
-                        is_violation = False
-                        break
-                
-                if is_violation:
-                    simulated_violations.append({
-                        "frequency_khz": violation_freq,
-                        "frequency_mhz": violation_freq / 1000.0,
-                        "power": float(fft_data[violation_idx]),
-                        "timestamp": time.time(),
-                        "simulated": True
-                    })
+                if not eibi_mask[violation_idx]:
+                    violation_khz = np.array([violation_freq])
+                    violation_power = fft_data[violation_idx:violation_idx + 1].copy()
+                    violation_time = time.time()
+                    simulated_violations = violation_records(
+                        violation_khz, violation_power, violation_time, simulated=True
+                    )
                     
                     # Increase the signal strength at violation point for visibility
                     fft_data[violation_idx-3:violation_idx+4] *= 1.5
             
-            # Log simulated violations to MongoDB if available
-            if violations_collection and simulated_violations:
-                try:
-                    violations_collection.insert_many(simulated_violations)
-                except Exception as e:
-                    print(f"Error logging to MongoDB: {e}")
-            
-            # Package data for WebSocket
-            data = {
-                "freqs": freqs.tolist(),
-                "amplitudes": fft_data.tolist(),
-                "violations": simulated_violations,
-                "timestamp": time.time()
-            }
+            # Queue simulated violations for MongoDB if available
+            if violation_log and simulated_violations:
+                violation_log.add(violation_khz, violation_power, violation_time, simulated=True)
             
-            # Convert to JSON string
-            json_data = json.dumps(data)
+            # Package data for WebSocket as a binary frame
+            frame = encode_spectrum_frame(freq_start, freq_step, fft_data, simulated_violations, time.time())
             
-            # Send to WebSocket
-            await websocket.send(json_data)
+            # Send to WebSocket (waits for the transport to drain)
+            await websocket.send(frame)
             
             # Log data being sent with violation information
             if simulated_violations:
@@ -293,7 +576,7 @@ async def simulate_sdr_with_detection(websocket, eibi_db, violations_collection)
                 print(f"Sent simulated SDR data: {len(freqs)} points, no violations")
             
             # Limit update rate
-            await asyncio.sleep(0.1)
+            next_tick = await wait_next_tick(loop, next_tick)
     
     except websockets.exceptions.ConnectionClosed:
         print("Client disconnected")
@@ -306,17 +589,39 @@ async def main():
     
     # Load EIBI database
     eibi_db = load_eibi_data()
+    eibi_freqs_khz = build_eibi_index(eibi_db)
     
     # Setup MongoDB connection
     violations_collection = setup_mongodb()
+    violation_log = None
+    flush_task = None
+    if violations_collection is not None:
+        violation_log = ViolationLog(violations_collection)
+        flush_task = asyncio.create_task(violation_log.run())
     
     print(f"Starting SDR WebSocket server with violation detection on port {WS_PORT}")
-    async with websockets.serve(
-        lambda ws, path: sdr_stream_with_detection(ws, path, eibi_db, violations_collection),
-        "0.0.0.0", 
-        WS_PORT
-    ):
-        await asyncio.Future()  # Run forever
+    try:
+        async with websockets.serve(
+            lambda ws, path: sdr_stream_with_detection(ws, path, eibi_freqs_khz, violation_log),
+            "0.0.0.0", 
+            WS_PORT
+        ):
+            await asyncio.Future()  # Run forever
+    finally:
+        # Cancelling the flush task runs its final flush of buffered violations
+        if flush_task is not None:
+            flush_task.cancel()
+            try:
+                await flush_task
+            except asyncio.CancelledError:
+                pass
 
 if __name__ == "__main__":
+    # Use uvloop's faster event loop when available
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     asyncio.run(main())
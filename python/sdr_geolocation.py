@@ -1,16 +1,227 @@
 import numpy as np
 import json
+import os
+import sys
 import time
 import math
 import aiohttp
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import List, Dict, Tuple, Optional, Union
-from scipy.optimize import minimize
+from scipy.optimize import least_squares
+from scipy.spatial.distance import cdist
 from haversine import haversine, Unit
 from kiwisdr_client import KiwiSDRClient, KiwiStation
 
-@dataclass
+# Handle optional orjson import
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+    print("orjson not available - using json for serialization")
+
+# Handle optional Numba import
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+    print("Numba not available - using NumPy geolocation kernels")
+
+# Decode a JSON document from bytes (or str), with orjson's C parser when available
+def _json_loads(data: Union[bytes, str]):
+    if HAVE_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# WGS84 ellipsoid semi-major axis (m) and first eccentricity squared
+WGS84_A = 6378137.0
+WGS84_E2 = 6.69437999014e-3
+
+def geodetic_to_ecef(lat, lon, alt):
+    """
+    Convert geodetic coordinates to Earth-Centered Earth-Fixed (ECEF) coordinates
+    
+    Args:
+        lat, lon: Latitude and longitude in degrees (scalars or arrays)
+        alt: Altitude above the ellipsoid in meters
+        
+    Returns:
+        (x, y, z) in meters
+    """
+    lat_rad = np.radians(lat)
+    lon_rad = np.radians(lon)
+    sin_lat = np.sin(lat_rad)
+    cos_lat = np.cos(lat_rad)
+    
+    # Prime vertical radius of curvature
+    n = WGS84_A / np.sqrt(1.0 - WGS84_E2 * sin_lat ** 2)
+    
+    x = (n + alt) * cos_lat * np.cos(lon_rad)
+    y = (n + alt) * cos_lat * np.sin(lon_rad)
+    z = (n * (1.0 - WGS84_E2) + alt) * sin_lat
+    return x, y, z
+
+def ecef_to_geodetic(x, y, z):
+    """
+    Convert Earth-Centered Earth-Fixed (ECEF) coordinates to geodetic coordinates
+    (Bowring's method, millimeter-accurate near the Earth's surface)
+    
+    Args:
+        x, y, z: ECEF coordinates in meters (scalars or arrays)
+        
+    Returns:
+        (latitude, longitude, altitude) in degrees and meters
+    """
+    b = WGS84_A * math.sqrt(1.0 - WGS84_E2)
+    ep2 = (WGS84_A ** 2 - b ** 2) / b ** 2
+    p = np.hypot(x, y)
+    
+    theta = np.arctan2(z * WGS84_A, p * b)
+    lat_rad = np.arctan2(z + ep2 * b * np.sin(theta) ** 3, p - WGS84_E2 * WGS84_A * np.cos(theta) ** 3)
+    lon_rad = np.arctan2(y, x)
+    
+    n = WGS84_A / np.sqrt(1.0 - WGS84_E2 * np.sin(lat_rad) ** 2)
+    alt = p / np.cos(lat_rad) - n
+    return np.degrees(lat_rad), np.degrees(lon_rad), alt
+
+# Straight-line distances from a point to receivers in ECEF (see SDRGeolocation._ensure_cache)
+# and their analytic gradient, written into caller-owned buffers as one fused loop so
+# solver iterations don't allocate; compiled with Numba when available
+def _receiver_distances(coords, recv_xyz, distances, gradient):
+    """
+    Euclidean distance from coords to each receiver
+    
+    Args:
+        coords: (latitude°, longitude°, altitude m) of the point
+        recv_xyz: Receiver ECEF positions, shape (N, 3)
+        distances: Output buffer of shape (N,) for distances in meters
+        gradient: Output buffer of shape (N, 3) for the partial derivatives of each
+            distance with respect to (latitude°, longitude°, altitude m)
+    
+    Returns:
+        (distances, gradient)
+    """
+    lat_rad = math.radians(coords[0])
+    lon_rad = math.radians(coords[1])
+    alt = coords[2]
+    sin_lat = math.sin(lat_rad)
+    cos_lat = math.cos(lat_rad)
+    sin_lon = math.sin(lon_rad)
+    cos_lon = math.cos(lon_rad)
+    
+    # The point in ECEF, plus its meridian (m) and prime vertical (n) radii of curvature
+    w2 = 1.0 - WGS84_E2 * sin_lat * sin_lat
+    n = WGS84_A / math.sqrt(w2)
+    m = n * (1.0 - WGS84_E2) / w2
+    x = (n + alt) * cos_lat * cos_lon
+    y = (n + alt) * cos_lat * sin_lon
+    z = (n * (1.0 - WGS84_E2) + alt) * sin_lat
+    
+    # d(point)/d(lat°, lon°, alt) by columns; distance gradients are unit vectors projected onto it
+    deg = math.pi / 180.0
+    dx_dlat = -(m + alt) * sin_lat * cos_lon * deg
+    dy_dlat = -(m + alt) * sin_lat * sin_lon * deg
+    dz_dlat = (m + alt) * cos_lat * deg
+    dx_dlon = -(n + alt) * cos_lat * sin_lon * deg
+    dy_dlon = (n + alt) * cos_lat * cos_lon * deg
+    dx_dalt = cos_lat * cos_lon
+    dy_dalt = cos_lat * sin_lon
+    dz_dalt = sin_lat
+    
+    for i in range(recv_xyz.shape[0]):
+        ux = x - recv_xyz[i, 0]
+        uy = y - recv_xyz[i, 1]
+        uz = z - recv_xyz[i, 2]
+        distance = math.sqrt(ux * ux + uy * uy + uz * uz)
+        distances[i] = distance
+        
+        inv = 1.0 / max(distance, 1e-9)
+        ux *= inv
+        uy *= inv
+        uz *= inv
+        gradient[i, 0] = ux * dx_dlat + uy * dy_dlat + uz * dz_dlat
+        gradient[i, 1] = ux * dx_dlon + uy * dy_dlon
+        gradient[i, 2] = ux * dx_dalt + uy * dy_dalt + uz * dz_dalt
+    
+    return distances, gradient
+
+# Compiled eagerly for the argument types the solvers pass (float64, C-contiguous),
+# so the compile (or on-disk cache load) happens at import rather than on the first fix
+if HAVE_NUMBA:
+    _receiver_distances = njit(
+        "(float64[::1], float64[:, ::1], float64[::1], float64[:, ::1])",
+        cache=True, fastmath=True, nogil=True
+    )(_receiver_distances)
+
+# Destination point on a sphere given start, distance (m) and bearing (radians, scalar
+# or array), shared by SDRGeolocation and GeoSimulator and compiled with Numba when
+# available. Arguments must be floats so every caller hits the same compiled signature.
+def _destination_point(lat, lon, distance, bearing):
+    # Convert to radians
+    lat_rad = math.radians(lat)
+    lon_rad = math.radians(lon)
+    
+    # Earth's radius in meters
+    R = 6371000
+    
+    # Terms that don't depend on the bearing
+    sin_lat = math.sin(lat_rad)
+    cos_lat = math.cos(lat_rad)
+    sin_d = math.sin(distance / R)
+    cos_d = math.cos(distance / R)
+    
+    # Calculate new latitude
+    lat2_rad = np.arcsin(sin_lat * cos_d + cos_lat * sin_d * np.cos(bearing))
+    
+    # Calculate new longitude
+    lon2_rad = lon_rad + np.arctan2(
+        np.sin(bearing) * sin_d * cos_lat,
+        cos_d - sin_lat * np.sin(lat2_rad)
+    )
+    
+    # Convert back to degrees
+    lat2 = np.degrees(lat2_rad)
+    lon2 = np.degrees(lon2_rad)
+    
+    return lat2, lon2
+
+if HAVE_NUMBA:
+    _destination_point = njit(
+        ["(float64, float64, float64, float64)", "(float64, float64, float64, float64[::1])"],
+        cache=True, fastmath=True
+    )(_destination_point)
+
+# Inverse square law path loss (simplified model): power ∝ 1/d², so power_tx is the
+# received power at a distance of 1 m. Shared by the simulator and the RSSI objective.
+def _received_power(power_tx, distances, out=None):
+    """Received power for an array of distances in meters, optionally into out"""
+    out = np.multiply(distances, distances, out=out)
+    return np.divide(power_tx, out, out=out)
+
+def _east_north_basis(origin):
+    """
+    Unit east and north vectors in ECEF at origin (latitude°, longitude°, ...),
+    as the rows of a (2, 3) array
+    """
+    lat_rad = math.radians(origin[0])
+    lon_rad = math.radians(origin[1])
+    return np.array([
+        [-math.sin(lon_rad), math.cos(lon_rad), 0.0],
+        [-math.sin(lat_rad) * math.cos(lon_rad), -math.sin(lat_rad) * math.sin(lon_rad), math.cos(lat_rad)],
+    ])
+
+def _snr_db(received_power, noise_floor):
+    """Signal-to-Noise Ratio in dB for an array of received powers"""
+    return 10 * np.log10(received_power / noise_floor)
+
+# Slotted dataclasses (Python 3.10+) have no per-instance __dict__, which keeps large
+# measurement lists smaller and attribute access faster; older Pythons get plain ones
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class SDRReceiver:
     """Represents an SDR receiver with known coordinates"""
     id: str
@@ -55,7 +266,7 @@ class SDRReceiver:
             active=data.get("active", True)
         )
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class SignalMeasurement:
     """Signal measurement from an SDR receiver"""
     receiver_id: str
@@ -109,73 +320,97 @@ class RemoteSDRHandler:
         self.session: Optional[aiohttp.ClientSession] = None
     
     async def __aenter__(self):
-        """Context manager entry"""
-        self.session = aiohttp.ClientSession()
+        """
+        Context manager entry. Opens the HTTP sessions once for the whole context so
+        repeated fetch_data calls reuse pooled keep-alive connections instead of
+        paying DNS, TCP and TLS setup on every call.
+        """
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=10, keepalive_timeout=60)
+            )
+            await self.providers["kiwisdr"]["client"].__aenter__()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit"""
         if self.session:
+            await self.providers["kiwisdr"]["client"].__aexit__(exc_type, exc_val, exc_tb)
             await self.session.close()
             self.session = None
     
     async def fetch_data(self, frequency: float) -> List[Dict]:
-        """Fetch data from remote SDR providers for the given frequency"""
+        """
+        Fetch data from remote SDR providers for the given frequency. Enabled
+        providers are queried concurrently, so this takes as long as the slowest one.
+        """
         if not self.session:
             raise RuntimeError("RemoteSDRHandler must be used as context manager")
-            
-        results = []
         
-        # Fetch from KiwiSDR network
+        fetchers = []
         if self.providers["kiwisdr"]["enabled"]:
-            try:
-                async with self.providers["kiwisdr"]["client"] as kiwi:
-                    measurements = await kiwi.get_measurements(
-                        frequency,
-                        max_stations=self.providers["kiwisdr"]["max_stations"]
-                    )
-                    
-                    for data in measurements:
-                        measurement = SignalMeasurement(
-                            receiver_id=f"kiwisdr_{data['station_id']}",
-                            frequency=frequency,
-                            power=data['signal_strength'],
-                            timestamp=data['timestamp'],
-                            snr=data['snr']
-                        )
-                        results.append({
-                            "provider": "kiwisdr",
-                            "data": data,
-                            "measurement": measurement
-                        })
-            except Exception as e:
-                print(f"Error fetching from KiwiSDR network: {e}")
-        
-        # Fetch from WebSDR network
+            fetchers.append(self._fetch_kiwisdr(frequency))
         if self.providers["websdr"]["enabled"]:
-            try:
-                async with self.session.get(
-                    f"{self.providers['websdr']['url']}/data",
-                    params={"freq": frequency/1e6},
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        measurement = SignalMeasurement(
-                            receiver_id=f"websdr_{data.get('station_id', 'unknown')}",
-                            frequency=frequency,
-                            power=data.get('power', 0.0),
-                            timestamp=time.time(),
-                            snr=data.get('snr')
-                        )
-                        results.append({
-                            "provider": "websdr",
-                            "data": data,
-                            "measurement": measurement
-                        })
-            except Exception as e:
-                print(f"Error fetching from WebSDR: {e}")
-                
+            fetchers.append(self._fetch_websdr(frequency))
+        
+        results = []
+        for provider_results in await asyncio.gather(*fetchers):
+            results.extend(provider_results)
+        return results
+    
+    async def _fetch_kiwisdr(self, frequency: float) -> List[Dict]:
+        """Fetch from KiwiSDR network"""
+        results = []
+        try:
+            measurements = await self.providers["kiwisdr"]["client"].get_measurements(
+                frequency,
+                max_stations=self.providers["kiwisdr"]["max_stations"]
+            )
+            
+            for data in measurements:
+                measurement = SignalMeasurement(
+                    receiver_id=f"kiwisdr_{data['station_id']}",
+                    frequency=frequency,
+                    power=data['signal_strength'],
+                    timestamp=data['timestamp'],
+                    snr=data['snr']
+                )
+                results.append({
+                    "provider": "kiwisdr",
+                    "data": data,
+                    "measurement": measurement
+                })
+        except Exception as e:
+            print(f"Error fetching from KiwiSDR network: {e}")
+        
+        return results
+    
+    async def _fetch_websdr(self, frequency: float) -> List[Dict]:
+        """Fetch from WebSDR network"""
+        results = []
+        try:
+            async with self.session.get(
+                f"{self.providers['websdr']['url']}/data",
+                params={"freq": frequency/1e6},
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                if response.status == 200:
+                    data = _json_loads(await response.read())
+                    measurement = SignalMeasurement(
+                        receiver_id=f"websdr_{data.get('station_id', 'unknown')}",
+                        frequency=frequency,
+                        power=data.get('power', 0.0),
+                        timestamp=time.time(),
+                        snr=data.get('snr')
+                    )
+                    results.append({
+                        "provider": "websdr",
+                        "data": data,
+                        "measurement": measurement
+                    })
+        except Exception as e:
+            print(f"Error fetching from WebSDR: {e}")
+        
         return results
     
     def create_virtual_receiver(self, provider_data: Dict) -> SDRReceiver:
@@ -208,37 +443,67 @@ class SDRGeolocation:
     # Speed of light in meters per second
     SPEED_OF_LIGHT = 299792458
     
+    # Points per side of the grid of candidate RSSI starting points
+    RSSI_SEED_GRID = 16
+    
     def __init__(self):
         """Initialize geolocation engine"""
         self.receivers: Dict[str, SDRReceiver] = {}
         self.reference_receiver: Optional[str] = None
         self.remote_handler: Optional[RemoteSDRHandler] = None
+        
+        # Receiver positions packed as arrays (structure of arrays) for the solvers,
+        # rebuilt lazily by _ensure_cache after receivers are added or removed
+        self._cache_valid = False
+        self._ids: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._lat = np.empty(0)
+        self._lon = np.empty(0)
+        self._alt = np.empty(0)
+        self._active_mask = np.empty(0, dtype=bool)
+        self._ecef = np.empty((0, 3))
+        self._pairwise_distances: Optional[np.ndarray] = None
     
     async def init_remote_handler(self):
         """Initialize the remote SDR handler"""
         self.remote_handler = RemoteSDRHandler()
         return self.remote_handler
     
+    async def close_remote_handler(self):
+        """Close the remote SDR handler's connections"""
+        if self.remote_handler:
+            await self.remote_handler.__aexit__(None, None, None)
+    
     async def add_remote_measurements(self, frequency: float, measurements: List[SignalMeasurement]):
-        """Add measurements from remote SDR providers"""
+        """
+        Add measurements from remote SDR providers. The handler's connections are
+        opened on first use and kept until close_remote_handler.
+        """
         if not self.remote_handler:
             return
+        
+        await self.remote_handler.__aenter__()
+        remote_results = await self.remote_handler.fetch_data(frequency)
+        
+        for result in remote_results:
+            # Add virtual receiver
+            receiver = self.remote_handler.create_virtual_receiver(result)
+            self.add_receiver(receiver)
             
-        async with self.remote_handler:
-            remote_results = await self.remote_handler.fetch_data(frequency)
-            
-            for result in remote_results:
-                # Add virtual receiver
-                receiver = self.remote_handler.create_virtual_receiver(result)
-                self.add_receiver(receiver)
-                
-                # Add measurement
-                if 'measurement' in result:
-                    measurements.append(result['measurement'])
+            # Add measurement
+            if 'measurement' in result:
+                measurements.append(result['measurement'])
     
     def add_receiver(self, receiver: SDRReceiver) -> None:
         """Add or update an SDR receiver"""
+        # Re-adding a receiver that hasn't moved (remote receivers come back with every
+        # fetch, only their timestamp changes) keeps the packed arrays and their ECEF
+        # positions; replacing an existing key doesn't change the receiver order
+        previous = self.receivers.get(receiver.id)
         self.receivers[receiver.id] = receiver
+        if previous is None or previous.get_coordinates() != receiver.get_coordinates() \
+                or previous.active != receiver.active:
+            self._invalidate()
         
         # If this is the first receiver, make it the reference by default
         if len(self.receivers) == 1:
@@ -248,6 +513,7 @@ class SDRGeolocation:
         """Remove an SDR receiver"""
         if receiver_id in self.receivers:
             del self.receivers[receiver_id]
+            self._invalidate()
             
             # If removed receiver was the reference, choose a new one if possible
             if self.reference_receiver == receiver_id and self.receivers:
@@ -260,6 +526,43 @@ class SDRGeolocation:
             return True
         return False
     
+    def _invalidate(self) -> None:
+        """Mark the packed receiver arrays stale; call after modifying a receiver in place"""
+        self._cache_valid = False
+    
+    def _ensure_cache(self) -> None:
+        """Rebuild the packed receiver arrays if the receivers changed"""
+        if self._cache_valid:
+            return
+        
+        receivers = list(self.receivers.values())
+        self._ids = [r.id for r in receivers]
+        self._index = {receiver_id: i for i, receiver_id in enumerate(self._ids)}
+        
+        coords = np.array([r.get_coordinates() for r in receivers], dtype=float).reshape(-1, 3)
+        self._lat = np.ascontiguousarray(coords[:, 0])
+        self._lon = np.ascontiguousarray(coords[:, 1])
+        self._alt = np.ascontiguousarray(coords[:, 2])
+        self._active_mask = np.array([r.active for r in receivers], dtype=bool)
+        
+        # ECEF positions for _receiver_distances, so the solvers only convert their guess
+        self._ecef = np.column_stack(geodetic_to_ecef(self._lat, self._lon, self._alt)).reshape(-1, 3)
+        self._pairwise_distances = None
+        self._cache_valid = True
+    
+    def pairwise_receiver_distances(self) -> np.ndarray:
+        """
+        Straight-line distances in meters between all receivers
+        
+        Returns:
+            Array of shape (N, N), rows and columns in self.receivers order. Computed
+            once and reused until receivers change.
+        """
+        self._ensure_cache()
+        if self._pairwise_distances is None:
+            self._pairwise_distances = cdist(self._ecef, self._ecef)
+        return self._pairwise_distances
+    
     def get_active_receivers(self) -> List[SDRReceiver]:
         """Get list of active receivers"""
         return [r for r in self.receivers.values() if r.active]
@@ -272,20 +575,21 @@ class SDRGeolocation:
         if not self.reference_receiver:
             return signal_measurements
         
-        # Group measurements by receiver
-        measurements_by_receiver = {}
-        for measurement in signal_measurements:
-            measurements_by_receiver[measurement.receiver_id] = measurement
+        # Reference time is the latest measurement from the reference receiver
+        reference_receiver = self.reference_receiver
+        reference_time = next(
+            (m.timestamp for m in reversed(signal_measurements) if m.receiver_id == reference_receiver),
+            None
+        )
         
         # If we don't have a measurement from the reference receiver, can't calculate TDoA
-        if self.reference_receiver not in measurements_by_receiver:
+        if reference_time is None:
             return signal_measurements
         
-        reference_time = measurements_by_receiver[self.reference_receiver].timestamp
-        
-        # Calculate TDoA for each measurement
+        # Calculate TDoA in a single pass; for the handful of measurements per signal
+        # this is cheaper than packing timestamps into an array and back
         for measurement in signal_measurements:
-            if measurement.receiver_id != self.reference_receiver:
+            if measurement.receiver_id != reference_receiver:
                 measurement.tdoa = measurement.timestamp - reference_time
         
         return signal_measurements
@@ -298,71 +602,174 @@ class SDRGeolocation:
             Optional tuple of (latitude, longitude, altitude)
         """
         # Need at least 4 receivers for 3D positioning, 3 for 2D
-        active_receivers = self.get_active_receivers()
-        if len(active_receivers) < 3:
+        self._ensure_cache()
+        if np.count_nonzero(self._active_mask) < 3:
             return None
         
-        # Group measurements by receiver
-        measurements_by_receiver = {}
-        for measurement in signal_measurements:
-            if measurement.tdoa is not None:
-                measurements_by_receiver[measurement.receiver_id] = measurement
+        # Scatter measured TDoA into a per-receiver array (NaN = no measurement);
+        # a later measurement from the same receiver replaces an earlier one
+        with_tdoa = [m for m in signal_measurements if m.tdoa is not None]
+        tdoa_by_receiver = np.full(len(self._ids), np.nan)
+        for measurement in with_tdoa:
+            tdoa_by_receiver[self._index[measurement.receiver_id]] = measurement.tdoa
         
         # Need TDoA measurements from at least 3 receivers (including reference)
-        if len(measurements_by_receiver) < 3:
+        has_tdoa = ~np.isnan(tdoa_by_receiver)
+        if np.count_nonzero(has_tdoa) < 3:
             return None
         
-        # Function to minimize: sum of squared differences between measured and predicted TDoA
-        def error_function(coords):
-            lat, lon, alt = coords
-            error_sum = 0
-            
-            # Get reference receiver coordinates
-            ref_receiver = self.receivers[self.reference_receiver]
-            ref_coords = (ref_receiver.latitude, ref_receiver.longitude, ref_receiver.altitude)
-            
-            # Calculate distance from hypothesized transmitter to reference receiver
-            ref_distance = self._calculate_distance(ref_coords, (lat, lon, alt))
-            
-            # Calculate expected TDoA for each receiver and compare to measured
-            for receiver_id, measurement in measurements_by_receiver.items():
-                if receiver_id == self.reference_receiver:
-                    continue
-                
-                receiver = self.receivers[receiver_id]
-                receiver_coords = (receiver.latitude, receiver.longitude, receiver.altitude)
-                
-                # Distance from hypothesized transmitter to this receiver
-                distance = self._calculate_distance(receiver_coords, (lat, lon, alt))
-                
-                # Expected time difference (TDoA) based on distance difference
-                expected_tdoa = (distance - ref_distance) / self.SPEED_OF_LIGHT
-                
-                # Add squared error
-                error_sum += (expected_tdoa - measurement.tdoa) ** 2
+        # Gather receiver positions and measured TDoA into arrays once, since the
+        # optimizer evaluates the residuals many times.
+        # Row 0 is the reference receiver, the rest pair up with tdoa_values.
+        reference_index = self._index[self.reference_receiver]
+        has_tdoa[reference_index] = False
+        other_indices = np.flatnonzero(has_tdoa)
+        
+        recv_xyz = self._ecef[np.concatenate(([reference_index], other_indices))]
+        tdoa_values = tdoa_by_receiver[other_indices]
+        
+        # Residuals: predicted minus measured range difference to the reference, in
+        # meters (scaled TDoA keeps the solver tolerances well conditioned)
+        range_diffs = tdoa_values * self.SPEED_OF_LIGHT
+        
+        # Local plane for the closed-form solution, at the average active receiver position
+        active = self._active_mask
+        centroid = (self._lat[active].mean(), self._lon[active].mean(), self._alt[active].mean())
+        
+        # Minimum quorum (three TDoA measurements): the linearized system is square, so
+        # its solution is the hyperbolas' intersection in the local plane and iterating
+        # from it doesn't improve the fit. Return it directly.
+        if len(range_diffs) == 3:
+            position = self._tdoa_linear_guess(recv_xyz, range_diffs, centroid)
+            if position is not None:
+                return tuple(position)
+        
+        # Kernel output buffers reused across solver iterations (the solver keeps
+        # the residual and Jacobian arrays it gets, so those are still fresh)
+        distances = np.empty(len(recv_xyz))
+        gradient = np.empty((len(recv_xyz), 3))
+        
+        # The solver asks for the Jacobian at the point whose residuals it just
+        # evaluated; one kernel call fills both, so remember which point that was
+        evaluated_at = np.full(3, np.nan)
+        
+        def evaluate(coords):
+            coords = np.asarray(coords, dtype=float)
+            if not np.array_equal(coords, evaluated_at):
+                _receiver_distances(coords, recv_xyz, distances, gradient)
+                evaluated_at[:] = coords
+        
+        def residuals(coords):
+            evaluate(coords)
+            return (distances[1:] - distances[0]) - range_diffs
+        
+        def jacobian(coords):
+            evaluate(coords)
+            return gradient[1:] - gradient[0]
+        
+        # Initial guess: closed-form linearized solution, or the average of active
+        # receiver positions when there are too few receivers for it
+        initial_guess = self._tdoa_linear_guess(recv_xyz, range_diffs, centroid)
+        if initial_guess is None:
+            initial_guess = list(centroid)
+        
+        # Gradient-based least squares with the analytic Jacobian. Levenberg-Marquardt
+        # needs at least as many residuals as unknowns; 'trf' covers 3 receivers.
+        method = 'lm' if len(range_diffs) >= len(initial_guess) else 'trf'
+        result = least_squares(residuals, initial_guess, jac=jacobian, method=method, x_scale='jac')
+        
+        if result.success:
+            lat, lon, alt = result.x.tolist()
+            return (lat, lon, alt)
+        
+        return None
+    
+    def _tdoa_linear_guess(self, recv_xyz, range_diffs, origin):
+        """
+        Closed-form TDoA position estimate used to seed the solver, or as the
+        solution itself for the minimum quorum of three range differences
+        
+        Squaring |p_i - x| = |p_0 - x| + r_i makes the problem linear in the transmitter
+        position x and its range to the reference receiver p_0. This is solved by linear
+        least squares in the local horizontal (east/north) plane at origin, since
+        receivers spread over the ground constrain height poorly.
+        
+        Args:
+            recv_xyz: ECEF receiver positions, reference receiver first
+            range_diffs: Measured range differences to the reference receiver in meters
+            origin: (latitude, longitude, altitude) of the local plane
             
-            return error_sum
+        Returns:
+            [latitude, longitude, altitude] or None if the system is underdetermined
+        """
+        # Unknowns are east, north and the range to the reference receiver
+        if len(range_diffs) < 3:
+            return None
         
-        # Initial guess: average of receiver positions
-        avg_lat = sum(r.latitude for r in active_receivers) / len(active_receivers)
-        avg_lon = sum(r.longitude for r in active_receivers) / len(active_receivers)
-        avg_alt = sum(r.altitude for r in active_receivers) / len(active_receivers)
+        east_north = _east_north_basis(origin)
         
-        initial_guess = [avg_lat, avg_lon, avg_alt]
+        # Receiver offsets from the reference receiver in the local plane
+        offsets = (recv_xyz[1:] - recv_xyz[0]) @ east_north.T
         
-        # Use optimization to find the transmitter location that minimizes the error
-        result = minimize(error_function, initial_guess, method='Powell')
+        A = np.column_stack((2 * offsets, 2 * range_diffs))
+        b = np.sum(offsets ** 2, axis=1) - range_diffs ** 2
+        solution, _, rank, _ = np.linalg.lstsq(A, b, rcond=None)
+        if rank < 3 or not np.all(np.isfinite(solution)):
+            return None
         
-        if result.success:
-            return tuple(result.x)
+        # Back to geodetic, at the origin's height in the local plane
+        origin_xyz = np.array(geodetic_to_ecef(*origin))
+        ref_east_north = (recv_xyz[0] - origin_xyz) @ east_north.T
+        guess_xyz = origin_xyz + (ref_east_north + solution[:2]) @ east_north
+        lat, lon, _ = ecef_to_geodetic(*guess_xyz)
+        return [float(lat), float(lon), float(origin[2])]
+    
+    def _rssi_linear_guess(self, recv_xyz, ranges, origin):
+        """
+        Closed-form RSSI position estimate used to seed the solver
         
-        return None
+        Subtracting the first receiver's |p_0 - x|² = r_0² from the others leaves
+        equations linear in the transmitter position x, solved by linear least squares
+        in the local horizontal (east/north) plane at origin.
+        
+        Args:
+            recv_xyz: ECEF receiver positions
+            ranges: Distances to the transmitter implied by each measured power, in meters
+            origin: (latitude, longitude, altitude) of the local plane
+            
+        Returns:
+            [latitude, longitude, altitude] or None if the system is underdetermined
+        """
+        # Unknowns are east and north
+        if len(ranges) < 3 or not np.all(np.isfinite(ranges)):
+            return None
+        
+        east_north = _east_north_basis(origin)
+        origin_xyz = np.array(geodetic_to_ecef(*origin))
+        positions = (recv_xyz - origin_xyz) @ east_north.T
+        
+        A = 2 * (positions[1:] - positions[0])
+        b = (np.sum(positions[1:] ** 2, axis=1) - np.sum(positions[0] ** 2)
+             - ranges[1:] ** 2 + ranges[0] ** 2)
+        solution, _, rank, _ = np.linalg.lstsq(A, b, rcond=None)
+        if rank < 2 or not np.all(np.isfinite(solution)):
+            return None
+        
+        lat, lon, _ = ecef_to_geodetic(*(origin_xyz + solution @ east_north))
+        return [float(lat), float(lon), float(origin[2])]
     
-    def geolocate_rssi(self, signal_measurements: List[SignalMeasurement]) -> Optional[Tuple[float, float, float]]:
+    def geolocate_rssi(self, signal_measurements: List[SignalMeasurement],
+                       starts: int = 1) -> Optional[Tuple[float, float, float]]:
         """
         Estimate transmitter location using Received Signal Strength (RSSI)
         This is less accurate than TDoA but can work with fewer receivers
         
+        Args:
+            signal_measurements: Signal measurements to locate the transmitter from
+            starts: Number of optimizer runs from different starting points, run in
+                parallel threads; the lowest-error result wins. More starts make it
+                less likely to return a local minimum for awkward geometries.
+        
         Returns:
             Optional tuple of (latitude, longitude, altitude)
         """
@@ -370,65 +777,124 @@ class SDRGeolocation:
         if len(signal_measurements) < 3:
             return None
         
-        # Function to minimize: weighted sum of squared differences between expected and measured power
-        def error_function(coords):
-            lat, lon, alt = coords
-            error_sum = 0
-            
-            for measurement in signal_measurements:
-                receiver = self.receivers.get(measurement.receiver_id)
-                if not receiver or not receiver.active:
-                    continue
-                
-                receiver_coords = (receiver.latitude, receiver.longitude, receiver.altitude)
-                
-                # Distance from hypothesized transmitter to this receiver
-                distance = self._calculate_distance(receiver_coords, (lat, lon, alt))
-                
-                # Expected power based on inverse square law (simplified model)
-                # Power ∝ 1/d²
-                expected_power = 1.0 / (distance ** 2)
-                
-                # Normalize expected power to range 0-1
-                max_expected = 1.0  # At distance=1
-                expected_power = expected_power / max_expected
-                
-                # Add squared error, weighted by SNR if available
-                weight = 1.0
-                if measurement.snr is not None:
-                    # Higher SNR means more reliable measurement
-                    weight = 10 ** (measurement.snr / 10)
-                
-                error_sum += weight * ((expected_power - measurement.power) ** 2)
-            
-            return error_sum
+        # Gather positions, measured power and weights of measurements from active receivers
+        self._ensure_cache()
+        usable = []
+        receiver_indices = []
+        for measurement in signal_measurements:
+            i = self._index.get(measurement.receiver_id)
+            if i is not None and self._active_mask[i]:
+                usable.append(measurement)
+                receiver_indices.append(i)
+        
+        recv_xyz = self._ecef[receiver_indices]
+        rssi_power = np.array([m.power for m in usable], dtype=float)
+        
+        # Residuals are weighted by SNR if available (higher SNR means more reliable
+        # measurement); the square root of the linear SNR, since least squares
+        # squares them. Computed once here, not per residual evaluation.
+        snr = np.array([np.nan if m.snr is None else m.snr for m in usable], dtype=float)
+        rssi_weights = np.sqrt(np.where(np.isnan(snr), 1.0, 10 ** (snr / 10)))
         
         # Initial guess: weighted average of receiver positions by signal strength
-        total_power = sum(m.power for m in signal_measurements)
+        total_power = rssi_power.sum()
         if total_power == 0:
             return None
         
-        avg_lat = 0.0
-        avg_lon = 0.0
-        avg_alt = 0.0
-        
-        for measurement in signal_measurements:
-            receiver = self.receivers.get(measurement.receiver_id)
-            if not receiver or not receiver.active:
-                continue
+        weights = rssi_power / total_power
+        lats = self._lat[receiver_indices]
+        lons = self._lon[receiver_indices]
+        initial_guess = [weights @ lats, weights @ lons, weights @ self._alt[receiver_indices]]
+        
+        def make_residuals():
+            # Buffers reused across the solver's many evaluations, one set per run so
+            # parallel runs don't share them (the solver keeps the residual and
+            # Jacobian arrays it gets, so those are fresh)
+            distances = np.empty(len(recv_xyz))
+            gradient = np.empty((len(recv_xyz), 3))
+            evaluated_at = np.full(3, np.nan)
             
-            weight = measurement.power / total_power
-            avg_lat += receiver.latitude * weight
-            avg_lon += receiver.longitude * weight
-            avg_alt += receiver.altitude * weight
-        
-        initial_guess = [avg_lat, avg_lon, avg_alt]
-        
-        # Use optimization to find the transmitter location that minimizes the error
-        result = minimize(error_function, initial_guess, method='Powell')
+            def evaluate(coords):
+                coords = np.asarray(coords, dtype=float)
+                if not np.array_equal(coords, evaluated_at):
+                    _receiver_distances(coords, recv_xyz, distances, gradient)
+                    evaluated_at[:] = coords
+            
+            # Weighted differences between expected and measured power. Expected
+            # power is based on inverse square law, normalized to 1.0 at distance=1.
+            def residuals(coords):
+                evaluate(coords)
+                return rssi_weights * (_received_power(1.0, distances) - rssi_power)
+            
+            # d(1/d²) = -2/d³ dd
+            def jacobian(coords):
+                evaluate(coords)
+                return (rssi_weights * -2.0 / distances ** 3)[:, None] * gradient
+            
+            return residuals, jacobian
+        
+        # Closed-form trilateration from the ranges the inverse square law implies;
+        # it starts the optimizer next to the answer for consistent measurements, but
+        # noisy or clipped powers can put it further off than the centroid
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ranges = 1.0 / np.sqrt(rssi_power)
+        candidates = [initial_guess]
+        linear_guess = self._rssi_linear_guess(recv_xyz, ranges, initial_guess)
+        if linear_guess is not None:
+            candidates.append(linear_guess)
+        
+        # Plus a coarse grid over the receiver network, so a poor centroid and
+        # closed-form fix still leave a start near the global minimum. The best fitting
+        # candidate starts the solver; all are scored from one (candidates x receivers)
+        # distance matrix.
+        span = max(np.ptp(lats), np.ptp(lons), 1e-3)
+        grid_lat, grid_lon = np.meshgrid(
+            np.linspace(lats.min() - span / 2, lats.max() + span / 2, self.RSSI_SEED_GRID),
+            np.linspace(lons.min() - span / 2, lons.max() + span / 2, self.RSSI_SEED_GRID)
+        )
+        candidates = np.vstack((
+            candidates,
+            np.column_stack((grid_lat.ravel(), grid_lon.ravel(), np.full(grid_lat.size, initial_guess[2])))
+        ))
+        candidate_xyz = np.column_stack(geodetic_to_ecef(*candidates.T))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            predicted = _received_power(1.0, cdist(candidate_xyz, recv_xyz))
+            costs = (predicted - rssi_power) ** 2 @ rssi_weights ** 2
+        initial_guess = candidates[np.nanargmin(costs)].tolist()
+        
+        # Any transmitter on Earth: latitude, longitude and an altitude between the
+        # Dead Sea shore and the stratosphere, in meters
+        bounds = ([-90.0, -180.0, -500.0], [90.0, 180.0, 40000.0])
+        
+        def solve(start):
+            # Bounded least squares with the analytic Jacobian keeps the search out of
+            # non-physical regions
+            residuals, jacobian = make_residuals()
+            start = np.clip(start, bounds[0], bounds[1])
+            return least_squares(residuals, start, jac=jacobian, method='trf', bounds=bounds, x_scale='jac')
+        
+        if starts <= 1:
+            result = solve(initial_guess)
+        else:
+            # Extra starting points on a ring around the initial guess, as wide as
+            # the receiver network
+            radius = max(np.ptp(lats), np.ptp(lons), 1e-3) / 2
+            angles = (2 * math.pi * np.arange(starts - 1)) / (starts - 1)
+            start_points = [initial_guess] + [
+                [initial_guess[0] + radius * math.cos(angle), initial_guess[1] + radius * math.sin(angle), initial_guess[2]]
+                for angle in angles.tolist()
+            ]
+            
+            # The distance kernel releases the GIL when compiled with Numba
+            with ThreadPoolExecutor(max_workers=min(starts, os.cpu_count() or 1)) as executor:
+                results = list(executor.map(solve, start_points))
+            
+            converged = [r for r in results if r.success]
+            result = min(converged, key=lambda r: r.cost) if converged else results[0]
         
         if result.success:
-            return tuple(result.x)
+            lat, lon, alt = result.x.tolist()
+            return (lat, lon, alt)
         
         return None
     
@@ -448,8 +914,33 @@ class SDRGeolocation:
         # Fall back to RSSI if TDoA failed
         return self.geolocate_rssi(signal_measurements)
     
+    def geolocate_batch(self, signal_batches: List[List[SignalMeasurement]],
+                        max_workers: Optional[int] = None) -> List[Optional[Tuple[float, float, float]]]:
+        """
+        Geolocate many independent signals with geolocate_hybrid, in parallel threads
+        
+        Args:
+            signal_batches: One list of signal measurements per signal
+            max_workers: Number of threads (default: one per CPU)
+            
+        Returns:
+            One optional (latitude, longitude, altitude) per signal, in input order
+        """
+        # Build the packed receiver arrays once, before the threads share them
+        self._ensure_cache()
+        
+        # A single worker gains nothing from a pool but the handoff overhead
+        max_workers = min(max_workers or os.cpu_count() or 1, len(signal_batches))
+        if max_workers <= 1:
+            return [self.geolocate_hybrid(measurements) for measurements in signal_batches]
+        
+        # The distance kernel releases the GIL when compiled with Numba
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.geolocate_hybrid, signal_batches))
+    
     def estimate_single_receiver(self, measurement: SignalMeasurement, 
-                                estimated_transmit_power: float = 1.0) -> List[Dict]:
+                                estimated_transmit_power: float = 1.0,
+                                num_points: int = 36) -> List[Dict]:
         """
         For a single receiver, estimate possible transmitter locations
         based on signal strength. Returns a list of possible locations
@@ -458,6 +949,7 @@ class SDRGeolocation:
         Args:
             measurement: Signal measurement from a single receiver
             estimated_transmit_power: Estimated power of the transmitter (normalized)
+            num_points: Number of points on the circle (36 = every 10 degrees)
             
         Returns:
             List of possible locations (lat/lon pairs) representing a probability circle
@@ -480,78 +972,24 @@ class SDRGeolocation:
         estimated_distance = math.sqrt(estimated_transmit_power / power) * 1000
         
         # Generate points on a circle around the receiver
-        circle_points = []
-        num_points = 36  # Number of points to generate (every 10 degrees)
+        angles = (2 * math.pi * np.arange(num_points)) / num_points
+        
+        # Calculate points at all angles and the given distance
+        lats, lons = _destination_point(
+            float(receiver.latitude),
+            float(receiver.longitude),
+            float(estimated_distance),
+            angles
+        )
         
-        for i in range(num_points):
-            angle = (2 * math.pi * i) / num_points
-            
-            # Calculate point at given angle and distance
-            lat, lon = self._get_point_at_distance(
-                receiver.latitude, 
-                receiver.longitude, 
-                estimated_distance, 
-                angle
-            )
-            
-            circle_points.append({
+        return [
+            {
                 "latitude": lat,
                 "longitude": lon,
                 "probability": 1.0 / num_points  # Equal probability for all points
-            })
-        
-        return circle_points
-    
-    def _calculate_distance(self, coords1, coords2):
-        """Calculate the great-circle distance between two points in meters"""
-        lat1, lon1, alt1 = coords1
-        lat2, lon2, alt2 = coords2
-        
-        # Calculate surface distance using Haversine formula
-        surface_distance = haversine((lat1, lon1), (lat2, lon2), unit=Unit.METERS)
-        
-        # Add altitude component using Pythagorean theorem
-        altitude_diff = alt2 - alt1
-        
-        # Total distance
-        return math.sqrt(surface_distance**2 + altitude_diff**2)
-    
-    def _get_point_at_distance(self, lat, lon, distance, bearing):
-        """
-        Calculate destination point given distance and bearing from starting point
-        
-        Args:
-            lat, lon: Starting coordinates in degrees
-            distance: Distance in meters
-            bearing: Bearing in radians (0 = North, π/2 = East)
-            
-        Returns:
-            (latitude, longitude) of destination point
-        """
-        # Convert to radians
-        lat_rad = math.radians(lat)
-        lon_rad = math.radians(lon)
-        
-        # Earth's radius in meters
-        R = 6371000
-        
-        # Calculate new latitude
-        lat2_rad = math.asin(
-            math.sin(lat_rad) * math.cos(distance / R) +
-            math.cos(lat_rad) * math.sin(distance / R) * math.cos(bearing)
-        )
-        
-        # Calculate new longitude
-        lon2_rad = lon_rad + math.atan2(
-            math.sin(bearing) * math.sin(distance / R) * math.cos(lat_rad),
-            math.cos(distance / R) - math.sin(lat_rad) * math.sin(lat2_rad)
-        )
-        
-        # Convert back to degrees
-        lat2 = math.degrees(lat2_rad)
-        lon2 = math.degrees(lon2_rad)
-        
-        return lat2, lon2
+            }
+            for lat, lon in zip(lats.tolist(), lons.tolist())
+        ]
     
     def to_dict(self) -> Dict:
         """Convert geolocation engine state to dictionary for serialization"""
@@ -571,6 +1009,21 @@ class SDRGeolocation:
         geo.reference_receiver = data.get("reference_receiver")
         
         return geo
+    
+    def to_json(self) -> bytes:
+        """Serialize geolocation engine state (as in to_dict) to JSON bytes"""
+        if HAVE_ORJSON:
+            # orjson serializes the receiver dataclasses natively, skipping to_dict
+            return orjson.dumps({
+                "receivers": self.receivers,
+                "reference_receiver": self.reference_receiver
+            })
+        return json.dumps(self.to_dict()).encode()
+    
+    @classmethod
+    def from_json(cls, data: Union[bytes, str]) -> 'SDRGeolocation':
+        """Create from JSON produced by to_json"""
+        return cls.from_dict(_json_loads(data))
 
 # Utility class for simulating geolocation data
 class GeoSimulator:
@@ -578,9 +1031,16 @@ class GeoSimulator:
     Utility class for simulating geolocation data for testing
     """
     
-    def __init__(self, speed_of_light=SDRGeolocation.SPEED_OF_LIGHT):
-        """Initialize the simulator"""
+    def __init__(self, speed_of_light=SDRGeolocation.SPEED_OF_LIGHT, seed=None):
+        """
+        Initialize the simulator
+        
+        Args:
+            speed_of_light: Propagation speed in meters per second
+            seed: Optional seed for reproducible measurement noise
+        """
         self.speed_of_light = speed_of_light
+        self.rng = np.random.default_rng(seed)
     
     def generate_receivers(self, center_lat: float, center_lon: float, 
                          radius_km: float, count: int) -> List[SDRReceiver]:
@@ -606,18 +1066,22 @@ class GeoSimulator:
             timestamp=time.time()
         ))
         
+        if count < 2:
+            return receivers
+        
         # Distribute remaining receivers in a circle
-        for i in range(1, count):
-            angle = (2 * math.pi * i) / (count - 1)
-            
-            # Calculate point at given angle and distance
-            lat, lon = self._get_point_at_distance(
-                center_lat, 
-                center_lon, 
-                radius_km * 1000,  # Convert to meters
-                angle
-            )
-            
+        indices = np.arange(1, count)
+        angles = (2 * math.pi * indices) / (count - 1)
+        
+        # Calculate points at all angles and the given distance
+        lats, lons = _destination_point(
+            float(center_lat),
+            float(center_lon),
+            float(radius_km * 1000),  # Convert to meters
+            angles
+        )
+        
+        for i, lat, lon in zip(indices.tolist(), lats.tolist(), lons.tolist()):
             receivers.append(SDRReceiver(
                 id=f"R{i}",
                 latitude=lat,
@@ -646,96 +1110,49 @@ class GeoSimulator:
         Returns:
             List of SignalMeasurement objects
         """
-        measurements = []
-        transmitter_coords = (transmitter_lat, transmitter_lon, transmitter_alt)
+        if not receivers:
+            return []
+        
+        count = len(receivers)
+        receiver_coords = np.array([r.get_coordinates() for r in receivers], dtype=float)
+        
+        # Calculate true distances to all receivers at once: straight-line (line of
+        # sight) distances in ECEF, the same model the solvers fit
+        receiver_xyz = np.column_stack(geodetic_to_ecef(*receiver_coords.T))
+        transmitter_xyz = np.array(geodetic_to_ecef(transmitter_lat, transmitter_lon, transmitter_alt))
+        distances = np.linalg.norm(receiver_xyz - transmitter_xyz, axis=1)
         
         # Calculate base time
         base_time = time.time()
         
-        for receiver in receivers:
-            receiver_coords = (receiver.latitude, receiver.longitude, receiver.altitude)
-            
-            # Calculate true distance
-            distance = self._calculate_distance(receiver_coords, transmitter_coords)
-            
-            # Calculate signal travel time
-            travel_time = distance / self.speed_of_light
-            
-            # Add some timing error
-            measured_time = base_time + travel_time + np.random.normal(0, time_error)
-            
-            # Calculate received power using inverse square law with some noise
-            received_power = power / (distance ** 2)
-            received_power += np.random.normal(0, noise_level)
-            received_power = max(0.001, min(1.0, received_power))  # Clamp between 0.001 and 1.0
-            
-            # Calculate SNR (simplified)
-            background_noise = 0.01
-            snr = 10 * math.log10(received_power / background_noise)
-            
-            # Create measurement
-            measurements.append(SignalMeasurement(
+        # Signal travel time plus some timing error
+        measured_times = base_time + distances / self.speed_of_light + self.rng.standard_normal(count) * time_error
+        
+        # Calculate received power using inverse square law with some noise,
+        # clamped between 0.001 and 1.0
+        received_powers = _received_power(power, distances)
+        received_powers += self.rng.standard_normal(count) * noise_level
+        np.clip(received_powers, 0.001, 1.0, out=received_powers)
+        
+        # Calculate SNR (simplified)
+        background_noise = 0.01
+        snrs = _snr_db(received_powers, background_noise)
+        
+        # Create measurements
+        return [
+            SignalMeasurement(
                 receiver_id=receiver.id,
                 frequency=frequency,
                 power=received_power,
                 timestamp=measured_time,
                 snr=snr,
                 modulation="AM"  # Example modulation
-            ))
-        
-        return measurements
-    
-    def _calculate_distance(self, coords1, coords2):
-        """Calculate the great-circle distance between two points in meters"""
-        lat1, lon1, alt1 = coords1
-        lat2, lon2, alt2 = coords2
-        
-        # Calculate surface distance using Haversine formula
-        surface_distance = haversine((lat1, lon1), (lat2, lon2), unit=Unit.METERS)
-        
-        # Add altitude component using Pythagorean theorem
-        altitude_diff = alt2 - alt1
-        
-        # Total distance
-        return math.sqrt(surface_distance**2 + altitude_diff**2)
+            )
+            for receiver, received_power, measured_time, snr in zip(
+                receivers, received_powers.tolist(), measured_times.tolist(), snrs.tolist()
+            )
+        ]
     
-    def _get_point_at_distance(self, lat, lon, distance, bearing):
-        """
-        Calculate destination point given distance and bearing from starting point
-        
-        Args:
-            lat, lon: Starting coordinates in degrees
-            distance: Distance in meters
-            bearing: Bearing in radians (0 = North, π/2 = East)
-            
-        Returns:
-            (latitude, longitude) of destination point
-        """
-        # Convert to radians
-        lat_rad = math.radians(lat)
-        lon_rad = math.radians(lon)
-        
-        # Earth's radius in meters
-        R = 6371000
-        
-        # Calculate new latitude
-        lat2_rad = math.asin(
-            math.sin(lat_rad) * math.cos(distance / R) +
-            math.cos(lat_rad) * math.sin(distance / R) * math.cos(bearing)
-        )
-        
-        # Calculate new longitude
-        lon2_rad = lon_rad + math.atan2(
-            math.sin(bearing) * math.sin(distance / R) * math.cos(lat_rad),
-            math.cos(distance / R) - math.sin(lat_rad) * math.sin(lat2_rad)
-        )
-        
-        # Convert back to degrees
-        lat2 = math.degrees(lat2_rad)
-        lon2 = math.degrees(lon2_rad)
-        
-        return lat2, lon2
-
 # Test and demo code
 if __name__ == "__main__":
     async def main():
@@ -809,5 +1226,7 @@ if __name__ == "__main__":
         print("\nSingle receiver estimate:")
         possible_locations = geo.estimate_single_receiver(measurements[0])
         print(f"Generated {len(possible_locations)} possible locations")
+        
+        await geo.close_remote_handler()
     
     asyncio.run(main())
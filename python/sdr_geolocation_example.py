@@ -8,7 +8,7 @@ to perform signal source geolocation using various techniques.
 
 import asyncio
 from haversine import Unit
-from haversine import haversine
+from haversine import haversine_vector
 
 # Import from our new modular library
 from sdr_geolocation_lib import (
@@ -72,47 +72,28 @@ async def simulate_basic_geolocation():
     # Calculate TDoA
     measurements_with_tdoa = geo.calculate_tdoa(measurements)
     
-    # Geolocate using TDoA
-    tdoa_result = geo.geolocate_tdoa(measurements_with_tdoa)
-    if tdoa_result:
-        tdoa_lat, tdoa_lon, tdoa_alt = tdoa_result
-        tdoa_error = haversine(
-            (tdoa_lat, tdoa_lon), 
-            (transmitter_lat, transmitter_lon), 
-            unit=Unit.KILOMETERS
-        )
-        print(f"\nTDoA geolocation result: ({tdoa_lat:.6f}, {tdoa_lon:.6f})")
-        print(f"Error: {tdoa_error:.2f} km")
-    else:
-        print("\nTDoA geolocation failed")
-    
-    # Geolocate using RSSI
-    rssi_result = geo.geolocate_rssi(measurements)
-    if rssi_result:
-        rssi_lat, rssi_lon, rssi_alt = rssi_result
-        rssi_error = haversine(
-            (rssi_lat, rssi_lon), 
-            (transmitter_lat, transmitter_lon), 
-            unit=Unit.KILOMETERS
-        )
-        print(f"\nRSSI geolocation result: ({rssi_lat:.6f}, {rssi_lon:.6f})")
-        print(f"Error: {rssi_error:.2f} km")
-    else:
-        print("\nRSSI geolocation failed")
-    
-    # Hybrid geolocation
-    hybrid_result = geo.geolocate_hybrid(measurements)
-    if hybrid_result:
-        hybrid_lat, hybrid_lon, hybrid_alt = hybrid_result
-        hybrid_error = haversine(
-            (hybrid_lat, hybrid_lon), 
-            (transmitter_lat, transmitter_lon), 
-            unit=Unit.KILOMETERS
-        )
-        print(f"\nHybrid geolocation result: ({hybrid_lat:.6f}, {hybrid_lon:.6f})")
-        print(f"Error: {hybrid_error:.2f} km")
-    else:
-        print("\nHybrid geolocation failed")
+    # Geolocate using TDoA, RSSI and both (hybrid)
+    results = {
+        "TDoA": geo.geolocate_tdoa(measurements_with_tdoa),
+        "RSSI": geo.geolocate_rssi(measurements),
+        "Hybrid": geo.geolocate_hybrid(measurements),
+    }
+    
+    # Errors of all successful results against the true position, in one call
+    located = [name for name, result in results.items() if result]
+    errors = dict(zip(located, haversine_vector(
+        [results[name][:2] for name in located],
+        [(transmitter_lat, transmitter_lon)] * len(located),
+        Unit.KILOMETERS
+    ).tolist())) if located else {}
+    
+    for name, result in results.items():
+        if result:
+            lat, lon, alt = result
+            print(f"\n{name} geolocation result: ({lat:.6f}, {lon:.6f})")
+            print(f"Error: {errors[name]:.2f} km")
+        else:
+            print(f"\n{name} geolocation failed")
 
 
 async def simulate_moving_transmitter():
@@ -173,15 +154,12 @@ async def simulate_moving_transmitter():
     # Process each set of measurements to track the transmitter
     print("\nTracking the transmitter:")
     
-    for i, measurements in enumerate(all_measurements):
+    # Geolocate every sample using TDoA
+    positions = geo.geolocate_track(all_measurements)
+    
+    for i, position in enumerate(positions):
         time = i * sample_interval_sec
         
-        # Calculate TDoA for this set of measurements
-        measurements_with_tdoa = geo.calculate_tdoa(measurements)
-        
-        # Geolocate using TDoA
-        position = geo.geolocate_tdoa(measurements_with_tdoa)
-        
         if position:
             lat, lon, alt = position
             print(f"Time {time}s: Located at ({lat:.6f}, {lon:.6f}, {alt:.1f}m)")
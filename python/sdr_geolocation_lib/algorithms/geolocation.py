@@ -5,14 +5,26 @@ This module contains the main SDRGeolocation class which combines
 different geolocation techniques.
 """
 
+import os
 import time
 import math
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
+import numpy as np
 
 from sdr_geolocation_lib.models import SDRReceiver, SignalMeasurement
 from sdr_geolocation_lib.remote import RemoteSDRHandler
-from .tdoa import calculate_tdoa, geolocate_tdoa
+from .tdoa import _calculate_tdoa_index, geolocate_tdoa
 from .rssi import geolocate_rssi
+from .solver import SolverContext
+
+
+# Bearings of the points estimate_single_receiver places around a receiver (every
+# 10 degrees), with their sines and cosines computed once at import
+RING_POINTS = 36
+_RING_BEARINGS = np.arange(RING_POINTS) * (2 * math.pi / RING_POINTS)
+_RING_SIN = np.sin(_RING_BEARINGS)
+_RING_COS = np.cos(_RING_BEARINGS)
 
 
 class SDRGeolocation:
@@ -26,6 +38,10 @@ class SDRGeolocation:
         self.receivers: Dict[str, SDRReceiver] = {}
         self.reference_receiver: Optional[str] = None
         self.remote_handler: Optional[RemoteSDRHandler] = None
+        
+        # Measurements grouped by receiver by the last calculate_tdoa call, with the
+        # list and its length they were built from, reused by geolocate_tdoa
+        self._last_tdoa_index: Optional[Tuple[List[SignalMeasurement], int, Dict[str, SignalMeasurement]]] = None
     
     async def init_remote_handler(self):
         """Initialize the remote SDR handler"""
@@ -84,13 +100,28 @@ class SDRGeolocation:
         """
         if not self.reference_receiver:
             return signal_measurements
-            
-        return calculate_tdoa(signal_measurements, self.reference_receiver)
+        
+        index = _calculate_tdoa_index(signal_measurements, self.reference_receiver)
+        self._last_tdoa_index = None if index is None else (signal_measurements, len(signal_measurements), index)
+        return signal_measurements
     
-    def geolocate_tdoa(self, signal_measurements: List[SignalMeasurement]) -> Optional[Tuple[float, float, float]]:
+    def geolocate_tdoa(self, signal_measurements: List[SignalMeasurement],
+                       starts: int = 1,
+                       context: Optional[SolverContext] = None,
+                       initial_guess: Optional[Tuple[float, float, float]] = None
+                       ) -> Optional[Tuple[float, float, float]]:
         """
         Geolocate a signal source using Time Difference of Arrival (TDoA)
         
+        Args:
+            signal_measurements: Signal measurements with TDoA values
+            starts: Number of candidate starting points; the solver refines the
+                one that fits best
+            context: Receiver positions prepared for the solvers, shared by
+                geolocate_hybrid
+            initial_guess: (latitude, longitude, altitude) to start the solver from,
+                e.g. the previous fix when tracking a moving transmitter
+        
         Returns:
             Optional tuple of (latitude, longitude, altitude)
         """
@@ -99,16 +130,36 @@ class SDRGeolocation:
         if len(active_receivers) < 3:
             return None
             
+        # Reuse the grouping from calculate_tdoa when called on the same list
+        index = None
+        if self._last_tdoa_index is not None:
+            last_measurements, last_count, last_index = self._last_tdoa_index
+            if last_measurements is signal_measurements and last_count == len(signal_measurements):
+                index = last_index
+        
         return geolocate_tdoa(signal_measurements, 
                              self.receivers, 
                              self.reference_receiver,
-                             self.SPEED_OF_LIGHT)
+                             self.SPEED_OF_LIGHT,
+                             starts,
+                             context,
+                             index,
+                             initial_guess)
     
-    def geolocate_rssi(self, signal_measurements: List[SignalMeasurement]) -> Optional[Tuple[float, float, float]]:
+    def geolocate_rssi(self, signal_measurements: List[SignalMeasurement],
+                       starts: int = 1,
+                       context: Optional[SolverContext] = None) -> Optional[Tuple[float, float, float]]:
         """
         Estimate transmitter location using Received Signal Strength (RSSI)
         This is less accurate than TDoA but can work with fewer receivers
         
+        Args:
+            signal_measurements: Signal measurements with power values
+            starts: Number of candidate starting points; the solver refines the
+                one that fits best
+            context: Receiver positions prepared for the solvers, shared by
+                geolocate_hybrid
+        
         Returns:
             Optional tuple of (latitude, longitude, altitude)
         """
@@ -116,7 +167,7 @@ class SDRGeolocation:
         if len(signal_measurements) < 3:
             return None
             
-        return geolocate_rssi(signal_measurements, self.get_active_receivers())
+        return geolocate_rssi(signal_measurements, self.get_active_receivers(), starts, context)
     
     def geolocate_hybrid(self, signal_measurements: List[SignalMeasurement]) -> Optional[Tuple[float, float, float]]:
         """
@@ -126,13 +177,63 @@ class SDRGeolocation:
         Returns:
             Optional tuple of (latitude, longitude, altitude)
         """
+        # Receiver positions are converted once for both methods
+        context = SolverContext.from_receivers(self.receivers)
+        
         # Try TDoA first as it's generally more accurate
-        tdoa_result = self.geolocate_tdoa(signal_measurements)
+        tdoa_result = self.geolocate_tdoa(signal_measurements, context=context)
         if tdoa_result:
             return tdoa_result
         
         # Fall back to RSSI if TDoA failed
-        return self.geolocate_rssi(signal_measurements)
+        return self.geolocate_rssi(signal_measurements, context=context)
+    
+    def geolocate_track(self, measurement_sets: List[List[SignalMeasurement]],
+                        max_workers: Optional[int] = None) -> List[Optional[Tuple[float, float, float]]]:
+        """
+        Track a moving transmitter with TDoA, from one set of measurements per sample
+        
+        With a single worker the samples are solved in order, each starting from the
+        previous fix; with more they are solved independently in parallel threads.
+        
+        Args:
+            measurement_sets: One list of signal measurements per sample
+            max_workers: Number of threads (default: one per CPU)
+            
+        Returns:
+            One optional (latitude, longitude, altitude) per sample, in input order
+        """
+        # Need at least 4 receivers for 3D positioning, 3 for 2D
+        if len(self.get_active_receivers()) < 3 or not self.reference_receiver:
+            return [None] * len(measurement_sets)
+        
+        # Receiver positions are converted once for the whole track
+        context = SolverContext.from_receivers(self.receivers)
+        
+        def locate(measurements, initial_guess=None):
+            index = _calculate_tdoa_index(measurements, self.reference_receiver)
+            return geolocate_tdoa(measurements,
+                                  self.receivers,
+                                  self.reference_receiver,
+                                  self.SPEED_OF_LIGHT,
+                                  context=context,
+                                  measurements_by_receiver=index,
+                                  initial_guess=initial_guess)
+        
+        # A single worker gains nothing from a pool but the handoff overhead
+        max_workers = min(max_workers or os.cpu_count() or 1, len(measurement_sets))
+        if max_workers <= 1:
+            positions = []
+            last_position = None
+            for measurements in measurement_sets:
+                position = locate(measurements, last_position)
+                positions.append(position)
+                last_position = position or last_position
+            return positions
+        
+        # The residual kernels release the GIL when compiled with Numba
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(locate, measurement_sets))
     
     def estimate_single_receiver(self, measurement: SignalMeasurement, 
                                 estimated_transmit_power: float = 1.0) -> List[Dict]:
@@ -166,25 +267,30 @@ class SDRGeolocation:
         estimated_distance = math.sqrt(estimated_transmit_power / power) * 1000
         
         # Generate points on a circle around the receiver
-        circle_points = []
-        num_points = 36  # Number of points to generate (every 10 degrees)
+        num_points = RING_POINTS
         
-        for i in range(num_points):
-            angle = (2 * math.pi * i) / num_points
-            
-            # Calculate point at given angle and distance
-            lat, lon = self._get_point_at_distance(
-                receiver.latitude, 
-                receiver.longitude, 
-                estimated_distance, 
-                angle
-            )
-            
-            circle_points.append({
-                "latitude": lat,
-                "longitude": lon,
-                "probability": 1.0 / num_points  # Equal probability for all points
-            })
+        # Destination-point terms that don't depend on the bearing, computed once
+        # for the whole circle (see _get_point_at_distance)
+        lat_rad = math.radians(receiver.latitude)
+        lon_rad = math.radians(receiver.longitude)
+        sin_lat = math.sin(lat_rad)
+        cos_lat = math.cos(lat_rad)
+        angular_distance = estimated_distance / 6371000
+        sin_d = math.sin(angular_distance)
+        cos_d = math.cos(angular_distance)
+        
+        # Calculate all points at once
+        lat2_rad = np.arcsin(sin_lat * cos_d + cos_lat * sin_d * _RING_COS)
+        lon2_rad = lon_rad + np.arctan2(
+            _RING_SIN * sin_d * cos_lat,
+            cos_d - sin_lat * np.sin(lat2_rad)
+        )
+        
+        probability = 1.0 / num_points  # Equal probability for all points
+        circle_points = [
+            {"latitude": lat, "longitude": lon, "probability": probability}
+            for lat, lon in zip(np.degrees(lat2_rad).tolist(), np.degrees(lon2_rad).tolist())
+        ]
         
         return circle_points
     
@@ -207,16 +313,19 @@ class SDRGeolocation:
         # Earth's radius in meters
         R = 6371000
         
+        # Trig terms shared by the latitude and longitude formulas
+        sin_lat = math.sin(lat_rad)
+        cos_lat = math.cos(lat_rad)
+        sin_d = math.sin(distance / R)
+        cos_d = math.cos(distance / R)
+        
         # Calculate new latitude
-        lat2_rad = math.asin(
-            math.sin(lat_rad) * math.cos(distance / R) +
-            math.cos(lat_rad) * math.sin(distance / R) * math.cos(bearing)
-        )
+        lat2_rad = math.asin(sin_lat * cos_d + cos_lat * sin_d * math.cos(bearing))
         
         # Calculate new longitude
         lon2_rad = lon_rad + math.atan2(
-            math.sin(bearing) * math.sin(distance / R) * math.cos(lat_rad),
-            math.cos(distance / R) - math.sin(lat_rad) * math.sin(lat2_rad)
+            math.sin(bearing) * sin_d * cos_lat,
+            cos_d - sin_lat * math.sin(lat2_rad)
         )
         
         # Convert back to degrees
@@ -6,14 +6,97 @@ Received Signal Strength method.
 """
 
 from typing import Dict, List, Optional, Tuple
-from scipy.optimize import minimize
+import numpy as np
 
 from sdr_geolocation_lib.models import SDRReceiver, SignalMeasurement
-from .tdoa import calculate_distance
+from sdr_geolocation_lib.utils import enu_to_geodetic
+from .solver import SolverContext, solve_multistart
+
+# Handle optional Numba import (the residual kernels below run as plain Python without it)
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+def _rssi_residuals(point, positions, measured_power, weights):
+    """Weighted differences between inverse-square expected power and measured power"""
+    residuals = np.empty(positions.shape[0])
+    
+    for i in range(positions.shape[0]):
+        dx = point[0] - positions[i, 0]
+        dy = point[1] - positions[i, 1]
+        dz = point[2] - positions[i, 2]
+        residuals[i] = weights[i] * (1.0 / (dx * dx + dy * dy + dz * dz) - measured_power[i])
+    
+    return residuals
+
+
+def _rssi_jacobian(point, positions, weights):
+    """Jacobian of _rssi_residuals: d(1/d²) = -2/d⁴ times the offset from the receiver"""
+    jacobian = np.empty((positions.shape[0], 3))
+    
+    for i in range(positions.shape[0]):
+        dx = point[0] - positions[i, 0]
+        dy = point[1] - positions[i, 1]
+        dz = point[2] - positions[i, 2]
+        squared = max(dx * dx + dy * dy + dz * dz, 1e-18)
+        scale = weights[i] * -2.0 / (squared * squared)
+        jacobian[i, 0] = scale * dx
+        jacobian[i, 1] = scale * dy
+        jacobian[i, 2] = scale * dz
+    
+    return jacobian
+
+
+# Compiled eagerly for the argument types geolocate_rssi passes (float64, C-contiguous),
+# so the compile (or on-disk cache load) happens at import rather than on the first fix
+if HAVE_NUMBA:
+    _rssi_residuals = njit(
+        "float64[::1](float64[::1], float64[:, ::1], float64[::1], float64[::1])",
+        cache=True, fastmath=True, nogil=True
+    )(_rssi_residuals)
+    _rssi_jacobian = njit(
+        "float64[:, ::1](float64[::1], float64[:, ::1], float64[::1])",
+        cache=True, fastmath=True, nogil=True
+    )(_rssi_jacobian)
+
+
+def _linear_guess(positions, ranges):
+    """
+    Closed-form RSSI position estimate used to seed the solver
+    
+    Subtracting the first receiver's |p_0 - x|² = r_0² from the others leaves
+    equations linear in the transmitter position x, solved by linear least squares
+    in the horizontal (east/north) plane.
+    
+    Args:
+        positions: ENU receiver positions
+        ranges: Distances to the transmitter implied by each measured power, in meters
+        
+    Returns:
+        ENU point at the origin's height, or None if underdetermined
+    """
+    # Unknowns are east and north
+    if len(ranges) < 3 or not np.all(np.isfinite(ranges)):
+        return None
+    
+    horizontal = positions[:, :2]
+    A = 2 * (horizontal[1:] - horizontal[0])
+    b = (np.sum(horizontal[1:] ** 2, axis=1) - np.sum(horizontal[0] ** 2)
+         - ranges[1:] ** 2 + ranges[0] ** 2)
+    solution, _, rank, _ = np.linalg.lstsq(A, b, rcond=None)
+    if rank < 2 or not np.all(np.isfinite(solution)):
+        return None
+    
+    return np.array([solution[0], solution[1], 0.0])
 
 
 def geolocate_rssi(signal_measurements: List[SignalMeasurement],
-                  active_receivers: List[SDRReceiver]) -> Optional[Tuple[float, float, float]]:
+                  active_receivers: List[SDRReceiver],
+                  starts: int = 1,
+                  context: Optional[SolverContext] = None) -> Optional[Tuple[float, float, float]]:
     """
     Estimate transmitter location using Received Signal Strength (RSSI)
     This is less accurate than TDoA but can work with fewer receivers
@@ -21,6 +104,10 @@ def geolocate_rssi(signal_measurements: List[SignalMeasurement],
     Args:
         signal_measurements: List of signal measurements with power values
         active_receivers: List of active receivers
+        starts: Number of candidate starting points; the solver refines the one
+            that fits best
+        context: Receiver positions prepared from the receivers, when the caller
+            already has them
         
     Returns:
         Optional tuple of (latitude, longitude, altitude)
@@ -29,67 +116,71 @@ def geolocate_rssi(signal_measurements: List[SignalMeasurement],
     if len(signal_measurements) < 3:
         return None
     
-    # Create dictionary of receivers for quick lookup
-    receivers_dict = {r.id: r for r in active_receivers}
+    # Solve in a local East-North-Up frame centered on the average of active
+    # receiver positions, converted once since the solver evaluates the residuals
+    # many times
+    if context is None:
+        context = SolverContext.from_receivers({r.id: r for r in active_receivers})
     
-    # Function to minimize: weighted sum of squared differences between expected and measured power
-    def error_function(coords):
-        lat, lon, alt = coords
-        error_sum = 0
-        
-        for measurement in signal_measurements:
-            receiver = receivers_dict.get(measurement.receiver_id)
-            if not receiver:
-                continue
-            
-            receiver_coords = (receiver.latitude, receiver.longitude, receiver.altitude)
-            
-            # Distance from hypothesized transmitter to this receiver
-            distance = calculate_distance(receiver_coords, (lat, lon, alt))
-            
-            # Expected power based on inverse square law (simplified model)
-            # Power ∝ 1/d²
-            expected_power = 1.0 / (distance ** 2)
-            
-            # Normalize expected power to range 0-1
-            max_expected = 1.0  # At distance=1
-            expected_power = expected_power / max_expected
-            
-            # Add squared error, weighted by SNR if available
-            weight = 1.0
-            if measurement.snr is not None:
-                # Higher SNR means more reliable measurement
-                weight = 10 ** (measurement.snr / 10)
-            
-            error_sum += weight * ((expected_power - measurement.power) ** 2)
-        
-        return error_sum
+    # Positions and measured power of measurements from active receivers
+    usable = []
+    receiver_indices = []
+    for measurement in signal_measurements:
+        i = context.index.get(measurement.receiver_id)
+        if i is not None and context.active[i]:
+            usable.append(measurement)
+            receiver_indices.append(i)
+    
+    positions = context.positions[receiver_indices].reshape(-1, 3)
+    measured_power = np.array([m.power for m in usable], dtype=float)
     
     # Initial guess: weighted average of receiver positions by signal strength
-    total_power = sum(m.power for m in signal_measurements)
+    total_power = measured_power.sum()
     if total_power == 0:
         return None
     
-    avg_lat = 0.0
-    avg_lon = 0.0
-    avg_alt = 0.0
+    weighted_average = (measured_power / total_power) @ positions
     
-    for measurement in signal_measurements:
-        receiver = receivers_dict.get(measurement.receiver_id)
-        if not receiver:
-            continue
-        
-        weight = measurement.power / total_power
-        avg_lat += receiver.latitude * weight
-        avg_lon += receiver.longitude * weight
-        avg_alt += receiver.altitude * weight
+    # Residuals are weighted by SNR if available (higher SNR means more reliable
+    # measurement); the square root of the linear SNR, since least squares squares them
+    weights = np.sqrt(np.array([1.0 if m.snr is None else 10 ** (m.snr / 10) for m in usable]))
+    
+    # Residuals: weighted differences between expected and measured power. Expected
+    # power is based on inverse square law (simplified model), Power ∝ 1/d²,
+    # normalized to 1.0 at distance=1.
+    def residuals(point):
+        return _rssi_residuals(point, positions, measured_power, weights)
+    
+    # Jacobian: d(1/d²) = -2/d³ dd, and each distance's gradient is the unit vector
+    # from the receiver to the point
+    def jacobian(point):
+        return _rssi_jacobian(point, positions, weights)
+    
+    # Initial guess: closed-form trilateration from the ranges the inverse square law
+    # implies. It starts the solver next to the answer for consistent measurements,
+    # but noisy or clipped powers can put it further off than the weighted average,
+    # so it is only used when it fits the measurements better.
+    initial_guess = weighted_average
+    with np.errstate(divide='ignore'):
+        linear_guess = _linear_guess(positions, 1.0 / np.sqrt(measured_power))
+    if linear_guess is not None:
+        linear_residuals = residuals(linear_guess)
+        if linear_residuals @ linear_residuals < np.sum(residuals(initial_guess) ** 2):
+            initial_guess = linear_guess
+    
+    # Candidate starts scored from their distances to the receivers (candidates x receivers)
+    def seed_costs(distances):
+        return np.sum((weights * (1.0 / distances ** 2 - measured_power)) ** 2, axis=1)
     
-    initial_guess = [avg_lat, avg_lon, avg_alt]
+    result = solve_multistart(residuals, jacobian, positions, starts, initial_guess, seed_costs)
     
-    # Use optimization to find the transmitter location that minimizes the error
-    result = minimize(error_function, initial_guess, method='Powell')
+    # A closed-form start next to a receiver can stall on the steep 1/d² slope;
+    # retry from the weighted average then
+    if not result.success and initial_guess is linear_guess:
+        result = solve_multistart(residuals, jacobian, positions, starts, weighted_average, seed_costs)
     
     if result.success:
-        return tuple(result.x)
+        lat, lon, alt = enu_to_geodetic(result.x, context.origin)
+        return (float(lat), float(lon), float(alt))
     
-    return None
\ No newline at end of file
+    return None
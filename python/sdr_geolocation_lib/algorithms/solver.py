@@ -0,0 +1,172 @@
+"""
+Shared nonlinear least-squares driver for the geolocation algorithms.
+
+The TDoA and RSSI solvers both fit a point in a local East-North-Up frame
+around the receivers; this module picks the best of one or more starting
+points and runs that fit from it.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from scipy.optimize import OptimizeResult, least_squares
+from scipy.spatial.distance import cdist
+
+from sdr_geolocation_lib.models import SDRReceiver
+from sdr_geolocation_lib.utils import geodetic_to_enu
+
+
+# Extra starts are drawn from the receivers' bounding box widened by this margin
+# (meters), so a transmitter just outside the network is still covered
+START_MARGIN = 200.0
+
+
+@dataclass
+class SolverContext:
+    """
+    Receiver positions prepared for the solvers, built once and shared when
+    several methods run on the same receivers (e.g. hybrid geolocation)
+    """
+    ids: List[str]
+    index: Dict[str, int]
+    positions: np.ndarray  # ENU positions of all receivers in meters, shape (N, 3)
+    active: np.ndarray  # Boolean mask of active receivers
+    origin: Tuple[float, float, float]  # ENU origin: average of active receiver positions
+    
+    @classmethod
+    def from_receivers(cls, receivers: Dict[str, SDRReceiver]) -> 'SolverContext':
+        """Convert receivers to the local ENU frame at their active average"""
+        ids = list(receivers)
+        coords = np.array([receivers[receiver_id].get_coordinates() for receiver_id in ids], dtype=float).reshape(-1, 3)
+        active = np.array([receivers[receiver_id].active for receiver_id in ids], dtype=bool)
+        origin = tuple(coords[active].mean(axis=0).tolist()) if active.any() else (0.0, 0.0, 0.0)
+        positions = geodetic_to_enu(coords[:, 0], coords[:, 1], coords[:, 2], origin)
+        return cls(
+            ids=ids,
+            index={receiver_id: i for i, receiver_id in enumerate(ids)},
+            positions=np.ascontiguousarray(positions),
+            active=active,
+            origin=origin
+        )
+
+
+def levenberg_marquardt(residuals, jacobian, x0: np.ndarray, max_iter: int = 50,
+                        tol: float = 1e-10) -> OptimizeResult:
+    """
+    Minimize the sum of squared residuals over a 3D point by Levenberg-Marquardt
+    
+    The problems solved here have three unknowns and a handful of residuals, so
+    each step is one 3x3 damped normal-equations solve; this avoids the per-call
+    and per-iteration bookkeeping of scipy.optimize.least_squares.
+    
+    Args:
+        residuals: Function of the point returning the residual vector
+        jacobian: Function of the point returning the residual Jacobian
+        x0: Starting point
+        max_iter: Maximum number of Jacobian evaluations
+        tol: Relative tolerance on the cost decrease and the step length
+        
+    Returns:
+        OptimizeResult with x, cost (half the sum of squares) and success
+    """
+    x = np.array(x0, dtype=float)
+    r = residuals(x)
+    cost = 0.5 * (r @ r)
+    damping = None
+    
+    for nit in range(1, max_iter + 1):
+        J = jacobian(x)
+        A = J.T @ J
+        g = J.T @ r
+        if damping is None:
+            damping = 1e-3 * max(A.diagonal().max(), 1e-30)
+        
+        # Increase the damping until a step lowers the cost
+        while True:
+            try:
+                step = np.linalg.solve(A + damping * np.eye(3), -g)
+            except np.linalg.LinAlgError:
+                step = None
+            if step is not None:
+                x_new = x + step
+                r_new = residuals(x_new)
+                cost_new = 0.5 * (r_new @ r_new)
+                if cost_new <= cost:
+                    break
+            damping *= 4.0
+            if damping > 1e30:
+                return OptimizeResult(x=x, cost=cost, fun=r, nit=nit, success=cost == 0.0)
+        
+        # Converged when a step the linear model predicts well barely changes the
+        # cost, or the step itself is negligible
+        decrease = cost - cost_new
+        predicted = -(g @ step) - 0.5 * (step @ A @ step)
+        x, r, cost = x_new, r_new, cost_new
+        damping = max(damping / 3.0, 1e-30)
+        
+        if ((decrease <= tol * cost and decrease > 0.25 * predicted)
+                or np.linalg.norm(step) <= tol * (np.linalg.norm(x) + tol)):
+            return OptimizeResult(x=x, cost=cost, fun=r, nit=nit, success=True)
+    
+    return OptimizeResult(x=x, cost=cost, fun=r, nit=max_iter, success=False)
+
+
+def solve_multistart(residuals, jacobian, positions: np.ndarray, starts: int = 1,
+                     initial_guess: Optional[np.ndarray] = None, seed_costs=None):
+    """
+    Minimize residuals over an ENU point, from the best of several starting points
+    
+    The first candidate start is initial_guess (the ENU origin by default); the
+    others are drawn uniformly from the bounding box of the receiver positions.
+    All candidates are scored by the cost at the start and the solver refines the
+    lowest, which makes a local minimum less likely for awkward geometries while
+    costing one solve.
+    
+    Args:
+        residuals: Function of the ENU point returning the residual vector
+        jacobian: Function of the ENU point returning the residual Jacobian
+        positions: Receiver positions in the ENU frame, shape (N, 3)
+        starts: Number of candidate starting points
+        initial_guess: First candidate starting point in the ENU frame
+        seed_costs: Function of the (candidates x receivers) distance matrix
+            returning each candidate's sum of squared residuals; without it the
+            candidates are scored one residuals call at a time
+    
+    Returns:
+        scipy.optimize.OptimizeResult of the solve
+    """
+    if initial_guess is None:
+        initial_guess = np.zeros(3)
+    
+    start = initial_guess
+    if starts > 1:
+        # Fixed seed so the same measurements always give the same fix
+        rng = np.random.default_rng(0)
+        low = positions.min(axis=0) - START_MARGIN
+        high = positions.max(axis=0) + START_MARGIN
+        candidates = np.vstack((initial_guess, rng.uniform(low, high, size=(starts - 1, 3))))
+        
+        # All candidates are scored from one distance matrix
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if seed_costs is not None:
+                costs = seed_costs(cdist(candidates, positions))
+            else:
+                costs = np.array([np.sum(residuals(candidate) ** 2) for candidate in candidates])
+        start = candidates[np.argmin(np.where(np.isfinite(costs), costs, np.inf))]
+    
+    # Levenberg-Marquardt with the analytic Jacobian, falling back to SciPy's trust
+    # region solver if it doesn't converge
+    def solve(start):
+        result = levenberg_marquardt(residuals, jacobian, start)
+        if result.success:
+            return result
+        return least_squares(residuals, start, jac=jacobian, method='trf')
+    
+    result = solve(start)
+    
+    # A better scoring candidate can still lead the solver astray (e.g. stalling
+    # on a steep slope next to a receiver); initial_guess is the fallback then
+    if not result.success and start is not initial_guess:
+        result = solve(initial_guess)
+    
+    return result
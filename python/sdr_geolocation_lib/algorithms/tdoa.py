@@ -5,11 +5,108 @@ This module provides functions for signal source geolocation using the
 Time Difference of Arrival method.
 """
 
+import math
 from typing import Dict, List, Optional, Tuple
-from scipy.optimize import minimize
-from haversine import haversine, Unit
+import numpy as np
 
 from sdr_geolocation_lib.models import SDRReceiver, SignalMeasurement
+from sdr_geolocation_lib.utils import geodetic_to_enu, enu_to_geodetic
+from .solver import SolverContext, solve_multistart
+
+# Handle optional Numba import (the residual kernels below run as plain Python without it)
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+# Largest condition number of the receivers' horizontal spread for which
+# geolocate_tdoa runs the solver (1e6: about 10 m off the line of a 10 km baseline).
+# Above it the receivers are (nearly) in a line, which leaves the position
+# mirrored across it and the solver wandering until it gives up.
+MAX_CONDITION = 1e6
+
+
+def _tdoa_residuals(point, positions, range_diffs):
+    """Predicted minus measured range differences (m) to the reference receiver (row 0)"""
+    residuals = np.empty(range_diffs.shape[0])
+    
+    dx = point[0] - positions[0, 0]
+    dy = point[1] - positions[0, 1]
+    dz = point[2] - positions[0, 2]
+    reference_distance = math.sqrt(dx * dx + dy * dy + dz * dz)
+    
+    for i in range(1, positions.shape[0]):
+        dx = point[0] - positions[i, 0]
+        dy = point[1] - positions[i, 1]
+        dz = point[2] - positions[i, 2]
+        residuals[i - 1] = math.sqrt(dx * dx + dy * dy + dz * dz) - reference_distance - range_diffs[i - 1]
+    
+    return residuals
+
+
+def _tdoa_jacobian(point, positions):
+    """Jacobian of _tdoa_residuals: unit vectors to the point minus the reference's"""
+    jacobian = np.empty((positions.shape[0] - 1, 3))
+    
+    units = np.empty((positions.shape[0], 3))
+    for i in range(positions.shape[0]):
+        dx = point[0] - positions[i, 0]
+        dy = point[1] - positions[i, 1]
+        dz = point[2] - positions[i, 2]
+        inv = 1.0 / max(math.sqrt(dx * dx + dy * dy + dz * dz), 1e-9)
+        units[i, 0] = dx * inv
+        units[i, 1] = dy * inv
+        units[i, 2] = dz * inv
+    
+    for i in range(1, positions.shape[0]):
+        for j in range(3):
+            jacobian[i - 1, j] = units[i, j] - units[0, j]
+    
+    return jacobian
+
+
+# Compiled eagerly for the argument types geolocate_tdoa passes (float64, C-contiguous),
+# so the compile (or on-disk cache load) happens at import rather than on the first fix
+if HAVE_NUMBA:
+    _tdoa_residuals = njit(
+        "float64[::1](float64[::1], float64[:, ::1], float64[::1])",
+        cache=True, fastmath=True, nogil=True
+    )(_tdoa_residuals)
+    _tdoa_jacobian = njit(
+        "float64[:, ::1](float64[::1], float64[:, ::1])",
+        cache=True, fastmath=True, nogil=True
+    )(_tdoa_jacobian)
+
+
+def _linear_guess(positions, range_diffs):
+    """
+    Closed-form TDoA position estimate used to seed the solver
+    
+    Squaring |p_i - x| = |p_0 - x| + r_i makes the problem linear in the transmitter
+    position x and its range to the reference receiver p_0. This is solved by linear
+    least squares in the horizontal (east/north) plane, since receivers spread over
+    the ground constrain height poorly.
+    
+    Args:
+        positions: ENU receiver positions, reference receiver first
+        range_diffs: Measured range differences to the reference receiver in meters
+        
+    Returns:
+        ENU point at the reference receiver's height, or None if underdetermined
+    """
+    # Unknowns are east, north and the range to the reference receiver
+    if len(range_diffs) < 3:
+        return None
+    
+    offsets = positions[1:, :2] - positions[0, :2]
+    A = np.column_stack((2 * offsets, 2 * range_diffs))
+    b = np.sum(offsets ** 2, axis=1) - range_diffs ** 2
+    solution, _, rank, _ = np.linalg.lstsq(A, b, rcond=None)
+    if rank < 3 or not np.all(np.isfinite(solution)):
+        return None
+    
+    return np.array([positions[0, 0] + solution[0], positions[0, 1] + solution[1], positions[0, 2]])
 
 
 def calculate_tdoa(signal_measurements: List[SignalMeasurement], 
@@ -25,29 +122,51 @@ def calculate_tdoa(signal_measurements: List[SignalMeasurement],
     Returns:
         Signal measurements with TDoA values updated
     """
+    _calculate_tdoa_index(signal_measurements, reference_receiver_id)
+    return signal_measurements
+
+
+def _calculate_tdoa_index(signal_measurements: List[SignalMeasurement],
+                          reference_receiver_id: str) -> Optional[Dict[str, SignalMeasurement]]:
+    """
+    Calculate TDoA values like calculate_tdoa, grouping the measurements for
+    geolocate_tdoa in the same pass
+    
+    Returns:
+        Measurements with a TDoA value keyed by receiver ID, or None if there is
+        no measurement from the reference receiver
+    """
     # Group measurements by receiver
-    measurements_by_receiver = {}
+    latest_by_receiver = {}
     for measurement in signal_measurements:
-        measurements_by_receiver[measurement.receiver_id] = measurement
+        latest_by_receiver[measurement.receiver_id] = measurement
     
     # If we don't have a measurement from the reference receiver, can't calculate TDoA
-    if reference_receiver_id not in measurements_by_receiver:
-        return signal_measurements
+    if reference_receiver_id not in latest_by_receiver:
+        return None
     
-    reference_time = measurements_by_receiver[reference_receiver_id].timestamp
+    reference_time = latest_by_receiver[reference_receiver_id].timestamp
     
     # Calculate TDoA for each measurement
+    measurements_by_receiver = {}
     for measurement in signal_measurements:
         if measurement.receiver_id != reference_receiver_id:
             measurement.tdoa = measurement.timestamp - reference_time
+        if measurement.tdoa is not None:
+            measurements_by_receiver[measurement.receiver_id] = measurement
     
-    return signal_measurements
+    return measurements_by_receiver
 
 
 def geolocate_tdoa(signal_measurements: List[SignalMeasurement],
                  receivers: Dict[str, SDRReceiver],
                  reference_receiver_id: str,
-                 speed_of_light: float) -> Optional[Tuple[float, float, float]]:
+                 speed_of_light: float,
+                 starts: int = 1,
+                 context: Optional[SolverContext] = None,
+                 measurements_by_receiver: Optional[Dict[str, SignalMeasurement]] = None,
+                 initial_guess: Optional[Tuple[float, float, float]] = None
+                 ) -> Optional[Tuple[float, float, float]]:
     """
     Geolocate a signal source using Time Difference of Arrival (TDoA)
     
@@ -56,80 +175,83 @@ def geolocate_tdoa(signal_measurements: List[SignalMeasurement],
         receivers: Dictionary of available receivers keyed by ID
         reference_receiver_id: ID of the reference receiver
         speed_of_light: Speed of light in meters per second
+        starts: Number of candidate starting points; the solver refines the one
+            that fits best
+        context: Receiver positions prepared from receivers, when the caller
+            already has them
+        measurements_by_receiver: Measurements with TDoA values keyed by receiver
+            ID, when the caller already grouped them
+        initial_guess: (latitude, longitude, altitude) to start the solver from,
+            e.g. the previous fix when tracking a moving transmitter
     
     Returns:
         Optional tuple of (latitude, longitude, altitude)
     """
     # Group measurements by receiver
-    measurements_by_receiver = {}
-    for measurement in signal_measurements:
-        if measurement.tdoa is not None:
-            measurements_by_receiver[measurement.receiver_id] = measurement
+    if measurements_by_receiver is None:
+        measurements_by_receiver = {}
+        for measurement in signal_measurements:
+            if measurement.tdoa is not None:
+                measurements_by_receiver[measurement.receiver_id] = measurement
     
     # Need TDoA measurements from at least 3 receivers (including reference)
     if len(measurements_by_receiver) < 3:
         return None
-
-    # Function to minimize: sum of squared differences between measured and predicted TDoA
-    def error_function(coords):
-        lat, lon, alt = coords
-        error_sum = 0
-        
-        # Get reference receiver coordinates
-        ref_receiver = receivers[reference_receiver_id]
-        ref_coords = (ref_receiver.latitude, ref_receiver.longitude, ref_receiver.altitude)
-        
-        # Calculate distance from hypothesized transmitter to reference receiver
-        ref_distance = calculate_distance(ref_coords, (lat, lon, alt))
-        
-        # Calculate expected TDoA for each receiver and compare to measured
-        for receiver_id, measurement in measurements_by_receiver.items():
-            if receiver_id == reference_receiver_id:
-                continue
-            
-            receiver = receivers[receiver_id]
-            receiver_coords = (receiver.latitude, receiver.longitude, receiver.altitude)
-            
-            # Distance from hypothesized transmitter to this receiver
-            distance = calculate_distance(receiver_coords, (lat, lon, alt))
-            
-            # Expected time difference (TDoA) based on distance difference
-            expected_tdoa = (distance - ref_distance) / speed_of_light
-            
-            # Add squared error
-            error_sum += (expected_tdoa - measurement.tdoa) ** 2
-        
-        return error_sum
     
-    # Get all active receivers
-    active_receivers = [r for r in receivers.values() if r.active]
+    # Solve in a local East-North-Up frame centered on the average of active
+    # receiver positions, converted once since the solver evaluates the residuals
+    # many times
+    if context is None:
+        context = SolverContext.from_receivers(receivers)
     
-    # Initial guess: average of receiver positions
-    avg_lat = sum(r.latitude for r in active_receivers) / len(active_receivers)
-    avg_lon = sum(r.longitude for r in active_receivers) / len(active_receivers)
-    avg_alt = sum(r.altitude for r in active_receivers) / len(active_receivers)
+    # Row 0 is the reference receiver, the rest pair up with range_diffs
+    other_ids = [receiver_id for receiver_id in measurements_by_receiver if receiver_id != reference_receiver_id]
+    positions = context.positions[[context.index[receiver_id] for receiver_id in [reference_receiver_id] + other_ids]]
     
-    initial_guess = [avg_lat, avg_lon, avg_alt]
+    # Residuals are in meters (TDoA times the speed of light), which keeps the
+    # solver tolerances well conditioned
+    range_diffs = np.array([measurements_by_receiver[receiver_id].tdoa for receiver_id in other_ids]) * speed_of_light
     
-    # Use optimization to find the transmitter location that minimizes the error
-    result = minimize(error_function, initial_guess, method='Powell')
+    # Residuals: predicted minus measured range difference to the reference receiver
+    def residuals(point):
+        return _tdoa_residuals(point, positions, range_diffs)
     
-    if result.success:
-        return tuple(result.x)
+    # Jacobian: each distance's gradient is the unit vector from the receiver to the point
+    def jacobian(point):
+        return _tdoa_jacobian(point, positions)
     
-    return None
-
-
-def calculate_distance(coords1, coords2):
-    """Calculate the great-circle distance between two points in meters"""
-    lat1, lon1, alt1 = coords1
-    lat2, lon2, alt2 = coords2
+    # Give up early on degenerate geometry rather than running a doomed solve. The
+    # height is left out since receivers on flat ground never constrain it well.
+    spread = positions[:, :2] - positions[:, :2].mean(axis=0)
+    if np.linalg.cond(spread.T @ spread) > MAX_CONDITION:
+        return None
+    
+    # Initial guess: closed-form trilateration when there are enough range
+    # differences, which starts the solver next to the answer; otherwise the origin
+    start = _linear_guess(positions, range_diffs)
+    
+    # A caller's guess (e.g. the previous fix of a track) is used if it fits better.
+    # Receivers spread over the ground pin the height down poorly, so the solver
+    # only creeps towards it; the closed-form fix takes the guess's height instead
+    # of the reference receiver's.
+    if initial_guess is not None:
+        guess = geodetic_to_enu(*initial_guess, context.origin)
+        if start is None:
+            start = guess
+        else:
+            start[2] = guess[2]
+            guess_residuals = residuals(guess)
+            if guess_residuals @ guess_residuals < np.sum(residuals(start) ** 2):
+                start = guess
     
-    # Calculate surface distance using Haversine formula
-    surface_distance = haversine((lat1, lon1), (lat2, lon2), unit=Unit.METERS)
+    # Candidate starts scored from their distances to the receivers (candidates x receivers)
+    def seed_costs(distances):
+        return np.sum(((distances[:, 1:] - distances[:, :1]) - range_diffs) ** 2, axis=1)
     
-    # Add altitude component using Pythagorean theorem
-    altitude_diff = alt2 - alt1
+    result = solve_multistart(residuals, jacobian, positions, starts, start, seed_costs)
     
-    # Total distance
-    return (surface_distance**2 + altitude_diff**2) ** 0.5
\ No newline at end of file
+    if result.success:
+        lat, lon, alt = enu_to_geodetic(result.x, context.origin)
+        return (float(lat), float(lon), float(alt))
+    
+    return None
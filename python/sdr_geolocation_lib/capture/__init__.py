@@ -5,6 +5,6 @@ This module provides functionality for screen capture, image processing, and OCR
 to complement signal data acquisition.
 """
 
-from .capture import DataCapture, calculate_ssim
+from .capture import DataCapture, calculate_ssim, calculate_ssim_gpu
 
-__all__ = ['DataCapture', 'calculate_ssim']
\ No newline at end of file
+__all__ = ['DataCapture', 'calculate_ssim', 'calculate_ssim_gpu']
\ No newline at end of file
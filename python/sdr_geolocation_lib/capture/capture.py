@@ -21,11 +21,136 @@ import json
 # Configure logging
 logger = logging.getLogger('capture')
 
+# Change detection runs on frames shrunk by this factor per axis; screen changes
+# worth capturing survive it, and the work drops by its square
+CHANGE_DETECTION_SCALE = 0.25
+
+def downsample_gray(image, scale=CHANGE_DETECTION_SCALE):
+    """
+    Converts a frame to a downsampled grayscale image for change detection.
+    
+    Args:
+        image: Numpy array of the frame (BGRA as returned by mss, BGR, or grayscale)
+        scale: Resize factor applied to both axes
+        
+    Returns:
+        Downsampled grayscale image as numpy array
+    """
+    if image.ndim == 3:
+        code = cv2.COLOR_BGRA2GRAY if image.shape[2] == 4 else cv2.COLOR_BGR2GRAY
+        image = cv2.cvtColor(image, code)
+    return cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
 def calculate_ssim(img1, img2):
-    """Calculates the Structural Similarity Index (SSIM) between two images."""
-    img1 = cv2.cvtColor(img1, cv2.COLOR_BGR2GRAY)
-    img2 = cv2.cvtColor(img2, cv2.COLOR_BGR2GRAY)
-    return cv2.matchTemplate(img1, img2, cv2.TM_CCOEFF_NORMED)[0][0]
+    """
+    Calculates a similarity score between two frames for change detection.
+    
+    The score is the normalized cross-correlation of the downsampled grayscale
+    frames (1 for identical content), not the full Structural Similarity Index.
+    Two-dimensional inputs are taken as already prepared by downsample_gray.
+    """
+    if img1.ndim == 3:
+        img1 = downsample_gray(img1)
+    if img2.ndim == 3:
+        img2 = downsample_gray(img2)
+    
+    a = img1.astype(np.float32).ravel()
+    b = img2.astype(np.float32).ravel()
+    a -= a.mean()
+    b -= b.mean()
+    norm = np.sqrt(float(a @ a) * float(b @ b))
+    if norm == 0:
+        # Flat images carry no structure to correlate; compare them directly
+        return 1.0 if np.array_equal(img1, img2) else 0.0
+    return float(a @ b) / norm
+
+def cuda_available():
+    """Returns True when OpenCV was built with CUDA and a CUDA device is present."""
+    try:
+        return cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except (AttributeError, cv2.error):
+        return False
+
+class GpuFrameBuffer:
+    """
+    Device buffers for change detection with OpenCV's CUDA module.
+    
+    The buffers are allocated on the first frame and reused for every frame of
+    the same size afterwards. A frame is loaded into the current slot and,
+    once kept, becomes the previous frame the next one is compared to.
+    """
+    
+    def __init__(self, scale=CHANGE_DETECTION_SCALE):
+        """
+        Initialize the device buffers.
+        
+        Args:
+            scale: Resize factor applied to both axes before comparing
+        """
+        self.scale = scale
+        self.frame = cv2.cuda_GpuMat()
+        self.gray = cv2.cuda_GpuMat()
+        self.small = cv2.cuda_GpuMat()
+        self.product = cv2.cuda_GpuMat()
+        # Mean-centered float32 frames, with their means and sums of squares
+        self.current = cv2.cuda_GpuMat()
+        self.previous = cv2.cuda_GpuMat()
+        self.current_stats = (0.0, 0.0)
+        self.previous_stats = (0.0, 0.0)
+    
+    def load(self, image):
+        """
+        Uploads a frame and prepares it in the current slot.
+        
+        Args:
+            image: Numpy array of the frame (BGRA as returned by mss, BGR, or grayscale)
+        """
+        if image.ndim == 3:
+            self.frame.upload(image)
+            code = cv2.COLOR_BGRA2GRAY if image.shape[2] == 4 else cv2.COLOR_BGR2GRAY
+            cv2.cuda.cvtColor(self.frame, code, dst=self.gray)
+        else:
+            self.gray.upload(image)
+        cv2.cuda.resize(self.gray, (0, 0), dst=self.small, fx=self.scale, fy=self.scale,
+                        interpolation=cv2.INTER_AREA)
+        
+        width, height = self.small.size()
+        mean = cv2.cuda.sum(self.small)[0] / (width * height)
+        self.small.convertTo(cv2.CV_32F, self.current, 1.0, -mean)
+        self.current_stats = (mean, cv2.cuda.sqrSum(self.current)[0])
+    
+    def keep_current(self):
+        """Makes the current frame the previous one, swapping the buffers."""
+        self.previous, self.current = self.current, self.previous
+        self.previous_stats = self.current_stats
+    
+    def similarity(self):
+        """
+        Returns the normalized cross-correlation of the previous and current frames.
+        """
+        norm = np.sqrt(self.previous_stats[1] * self.current_stats[1])
+        if norm == 0:
+            # Flat images carry no structure to correlate; compare them directly
+            return 1.0 if self.previous_stats == self.current_stats else 0.0
+        cv2.cuda.multiply(self.previous, self.current, dst=self.product)
+        return cv2.cuda.sum(self.product)[0] / norm
+
+def calculate_ssim_gpu(img1, img2, buf):
+    """
+    Calculates the calculate_ssim score on the GPU, reusing the buffers in buf.
+    
+    Args:
+        img1: Numpy array of the first frame
+        img2: Numpy array of the second frame
+        buf: GpuFrameBuffer to work in
+        
+    Returns:
+        Normalized cross-correlation of the downsampled grayscale frames
+    """
+    buf.load(img1)
+    buf.keep_current()
+    buf.load(img2)
+    return buf.similarity()
 
 class DataCapture:
     """
@@ -53,7 +178,12 @@ class DataCapture:
         self.monitor_number = monitor_number
         self.region = region
         self.reader = easyocr.Reader(languages)
+        # One mss instance serves every grab; call close() when done capturing
+        self._sct = mss.mss()
         self.previous_frame = None
+        self._prev_small = None  # Downsampled grayscale copy of previous_frame
+        # Change detection runs on the GPU when OpenCV has a CUDA device
+        self._gpu_buf = GpuFrameBuffer() if cuda_available() else None
         self.frame_count = 0
         
         # Create monitor dict for specific region if provided
@@ -70,19 +200,21 @@ class DataCapture:
         """
         Captures a single frame from the specified monitor or region using mss.
         
+        The frame is a view of the screenshot's buffer rather than a copy, so it
+        is only valid until the next grab; copy it to keep it longer.
+        
         Returns:
-            Numpy array of the captured frame or None on error
+            Numpy array of the captured frame (BGRA) or None on error
         """
         try:
-            with mss.mss() as sct:
-                # If specific region is defined, use it, otherwise use the full monitor
-                if self.monitor:
-                    target = self.monitor
-                else:
-                    target = sct.monitors[self.monitor_number]
-                
-                sct_img = sct.grab(target)
-                return np.array(sct_img)
+            # If specific region is defined, use it, otherwise use the full monitor
+            if self.monitor:
+                target = self.monitor
+            else:
+                target = self._sct.monitors[self.monitor_number]
+            
+            sct_img = self._sct.grab(target)
+            return np.frombuffer(sct_img.raw, dtype=np.uint8).reshape(sct_img.height, sct_img.width, 4)
         except mss.exception.ScreenShotError as e:
             logger.error(f"Screenshot error: {e}")
             return None
@@ -90,6 +222,17 @@ class DataCapture:
             logger.error(f"Unexpected error during screen capture: {e}")
             return None
     
+    def close(self):
+        """Releases the screen capture resources."""
+        if self._sct is not None:
+            self._sct.close()
+            self._sct = None
+    
+    def __del__(self):
+        # __init__ may have failed before the mss instance was created
+        if getattr(self, '_sct', None) is not None:
+            self.close()
+    
     def preprocess_image(self, image):
         """
         Apply preprocessing to improve OCR results.
@@ -134,9 +277,18 @@ class DataCapture:
         # Ensure output directory exists
         os.makedirs(output_dir, exist_ok=True)
         
+        # Prepare the frame for change detection once per frame
+        if self._gpu_buf is not None:
+            self._gpu_buf.load(frame)
+        else:
+            small = downsample_gray(frame)
+        
         if self.previous_frame is not None:
             try:
-                ssim = calculate_ssim(self.previous_frame, frame)
+                if self._gpu_buf is not None:
+                    ssim = self._gpu_buf.similarity()
+                else:
+                    ssim = calculate_ssim(self._prev_small, small)
                 logger.debug(f"Frame {self.frame_count}: SSIM = {ssim:.4f}")
                 
                 # Check if current frame is significantly different from previous
@@ -206,8 +358,12 @@ class DataCapture:
             pil_img.save(image_path)
             logger.info(f"Saved initial frame {image_filename}")
             
-        # Update previous frame
+        # Update previous frame; the copy outlives the capture buffer frame views
         self.previous_frame = frame.copy()
+        if self._gpu_buf is not None:
+            self._gpu_buf.keep_current()
+        else:
+            self._prev_small = small
         return None  # No significant change or first frame
 
     def capture_and_process(self, output_dir, duration=10, frequency=None, 
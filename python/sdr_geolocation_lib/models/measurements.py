@@ -5,11 +5,16 @@ This module defines the SignalMeasurement class which represents
 signal measurements from SDR receivers.
 """
 
+import sys
 from dataclasses import dataclass
 from typing import Dict, Optional
 
+# Measurements are created per receiver per fix, so they are slotted (no
+# per-instance __dict__) where dataclasses support it (Python 3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class SignalMeasurement:
     """Signal measurement from an SDR receiver"""
     receiver_id: str
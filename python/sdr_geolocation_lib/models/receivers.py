@@ -4,12 +4,16 @@ SDR Receiver models.
 This module defines the SDRReceiver class which represents an SDR receiver with known coordinates.
 """
 
+import sys
 from dataclasses import dataclass
 from typing import Dict, Tuple
 from haversine import haversine, Unit
 
+# Slotted (no per-instance __dict__) where dataclasses support it (Python 3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class SDRReceiver:
     """Represents an SDR receiver with known coordinates"""
     id: str
@@ -434,16 +434,22 @@ class KiwiSDRClient:
             )
         )
         
-        # Capture IQ data (main task)
-        iq_data = await self.get_iq_data(
-            station,
-            frequency,
-            sample_rate,
-            duration
-        )
-        
-        # Wait for the screen capture task to complete
-        ocr_results = await screen_capture_task
+        try:
+            # Capture IQ data (main task)
+            iq_data = await self.get_iq_data(
+                station,
+                frequency,
+                sample_rate,
+                duration
+            )
+            
+            # Wait for the screen capture task to complete
+            ocr_results = await screen_capture_task
+        finally:
+            # A capture that hasn't started must not run on the closed capture object
+            if not screen_capture_task.done():
+                screen_capture_task.cancel()
+            data_capture.close()
         
         if iq_data is None:
             logger.error(f"Failed to capture IQ data from {station.name}")
@@ -9,9 +9,9 @@ import time
 import math
 import numpy as np
 from typing import List, Tuple
-from haversine import haversine, Unit
 
 from sdr_geolocation_lib.models import SDRReceiver, SignalMeasurement
+from sdr_geolocation_lib.utils import geodetic_to_enu
 
 
 class GeoSimulator:
@@ -93,15 +93,18 @@ class GeoSimulator:
         measurements = []
         transmitter_coords = (transmitter_lat, transmitter_lon, transmitter_alt)
         
+        # Calculate true distances to all receivers at once: straight-line (line of
+        # sight) distances in the transmitter's local East-North-Up frame, the same
+        # model the geolocation solvers fit
+        receiver_coords = np.array([r.get_coordinates() for r in receivers], dtype=float).reshape(-1, 3)
+        offsets = geodetic_to_enu(receiver_coords[:, 0], receiver_coords[:, 1], receiver_coords[:, 2],
+                                  transmitter_coords)
+        distances = np.linalg.norm(offsets, axis=1).tolist()
+        
         # Calculate base time
         base_time = time.time()
         
-        for receiver in receivers:
-            receiver_coords = (receiver.latitude, receiver.longitude, receiver.altitude)
-            
-            # Calculate true distance
-            distance = self._calculate_distance(receiver_coords, transmitter_coords)
-            
+        for receiver, distance in zip(receivers, distances):
             # Calculate signal travel time
             travel_time = distance / self.speed_of_light
             
@@ -176,20 +179,6 @@ class GeoSimulator:
         
         return all_measurements
     
-    def _calculate_distance(self, coords1, coords2):
-        """Calculate the great-circle distance between two points in meters"""
-        lat1, lon1, alt1 = coords1
-        lat2, lon2, alt2 = coords2
-        
-        # Calculate surface distance using Haversine formula
-        surface_distance = haversine((lat1, lon1), (lat2, lon2), unit=Unit.METERS)
-        
-        # Add altitude component using Pythagorean theorem
-        altitude_diff = alt2 - alt1
-        
-        # Total distance
-        return math.sqrt(surface_distance**2 + altitude_diff**2)
-    
     def _get_point_at_distance(self, lat, lon, distance, bearing):
         """
         Calculate destination point given distance and bearing from starting point
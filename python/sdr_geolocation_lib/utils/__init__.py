@@ -4,9 +4,20 @@ Utility functions for SDR geolocation.
 This module contains helper functions and utilities used across the library.
 """
 
-from .geo_utils import calculate_distance, get_point_at_distance
+from .geo_utils import (
+    calculate_distance,
+    get_point_at_distance,
+    geodetic_to_ecef,
+    ecef_to_geodetic,
+    geodetic_to_enu,
+    enu_to_geodetic,
+)
 
 __all__ = [
     "calculate_distance",
-    "get_point_at_distance"
+    "get_point_at_distance",
+    "geodetic_to_ecef",
+    "ecef_to_geodetic",
+    "geodetic_to_enu",
+    "enu_to_geodetic",
 ]
\ No newline at end of file
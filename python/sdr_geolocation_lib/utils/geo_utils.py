@@ -5,8 +5,13 @@ This module provides helper functions for geographic calculations.
 """
 
 import math
+import numpy as np
 from haversine import haversine, Unit
 
+# WGS84 ellipsoid semi-major axis (m) and first eccentricity squared
+WGS84_A = 6378137.0
+WGS84_E2 = 6.69437999014e-3
+
 
 def calculate_distance(coords1, coords2):
     """
@@ -67,4 +72,105 @@ def get_point_at_distance(lat, lon, distance, bearing):
     lat2 = math.degrees(lat2_rad)
     lon2 = math.degrees(lon2_rad)
     
-    return lat2, lon2
\ No newline at end of file
+    return lat2, lon2
+
+
+def geodetic_to_ecef(lat, lon, alt):
+    """
+    Convert geodetic coordinates to Earth-Centered Earth-Fixed (ECEF) coordinates
+    
+    Args:
+        lat, lon: Latitude and longitude in degrees (scalars or arrays)
+        alt: Altitude above the WGS84 ellipsoid in meters
+        
+    Returns:
+        (x, y, z) in meters
+    """
+    lat_rad = np.radians(lat)
+    lon_rad = np.radians(lon)
+    sin_lat = np.sin(lat_rad)
+    cos_lat = np.cos(lat_rad)
+    
+    # Prime vertical radius of curvature
+    n = WGS84_A / np.sqrt(1.0 - WGS84_E2 * sin_lat ** 2)
+    
+    x = (n + alt) * cos_lat * np.cos(lon_rad)
+    y = (n + alt) * cos_lat * np.sin(lon_rad)
+    z = (n * (1.0 - WGS84_E2) + alt) * sin_lat
+    return x, y, z
+
+
+def ecef_to_geodetic(x, y, z):
+    """
+    Convert Earth-Centered Earth-Fixed (ECEF) coordinates to geodetic coordinates
+    (Bowring's method, millimeter-accurate near the Earth's surface)
+    
+    Args:
+        x, y, z: ECEF coordinates in meters (scalars or arrays)
+        
+    Returns:
+        (latitude, longitude, altitude) in degrees and meters
+    """
+    b = WGS84_A * math.sqrt(1.0 - WGS84_E2)
+    ep2 = (WGS84_A ** 2 - b ** 2) / b ** 2
+    p = np.hypot(x, y)
+    
+    theta = np.arctan2(z * WGS84_A, p * b)
+    lat_rad = np.arctan2(z + ep2 * b * np.sin(theta) ** 3, p - WGS84_E2 * WGS84_A * np.cos(theta) ** 3)
+    lon_rad = np.arctan2(y, x)
+    
+    n = WGS84_A / np.sqrt(1.0 - WGS84_E2 * np.sin(lat_rad) ** 2)
+    alt = p / np.cos(lat_rad) - n
+    return np.degrees(lat_rad), np.degrees(lon_rad), alt
+
+
+def enu_rotation(lat, lon):
+    """
+    Rotation from ECEF to the local East-North-Up frame at (lat, lon) in degrees
+    
+    Returns:
+        (3, 3) array whose rows are the east, north and up unit vectors in ECEF
+    """
+    lat_rad = math.radians(lat)
+    lon_rad = math.radians(lon)
+    sin_lat, cos_lat = math.sin(lat_rad), math.cos(lat_rad)
+    sin_lon, cos_lon = math.sin(lon_rad), math.cos(lon_rad)
+    return np.array([
+        [-sin_lon, cos_lon, 0.0],
+        [-sin_lat * cos_lon, -sin_lat * sin_lon, cos_lat],
+        [cos_lat * cos_lon, cos_lat * sin_lon, sin_lat],
+    ])
+
+
+def geodetic_to_enu(lat, lon, alt, origin):
+    """
+    Convert geodetic coordinates to local East-North-Up (ENU) coordinates
+    
+    The conversion goes through ECEF and is exact, so straight-line distances
+    between points are the same in both frames.
+    
+    Args:
+        lat, lon, alt: Coordinates in degrees and meters (scalars or arrays)
+        origin: (latitude, longitude, altitude) of the ENU origin
+        
+    Returns:
+        Array of shape (..., 3) of east, north and up offsets in meters
+    """
+    xyz = np.stack(geodetic_to_ecef(lat, lon, alt), axis=-1)
+    origin_xyz = np.array(geodetic_to_ecef(*origin))
+    return (xyz - origin_xyz) @ enu_rotation(origin[0], origin[1]).T
+
+
+def enu_to_geodetic(enu, origin):
+    """
+    Convert local East-North-Up (ENU) coordinates back to geodetic coordinates
+    
+    Args:
+        enu: Array of shape (..., 3) of east, north and up offsets in meters
+        origin: (latitude, longitude, altitude) of the ENU origin
+        
+    Returns:
+        (latitude, longitude, altitude) in degrees and meters
+    """
+    xyz = np.array(geodetic_to_ecef(*origin)) + np.asarray(enu) @ enu_rotation(origin[0], origin[1])
+    return ecef_to_geodetic(xyz[..., 0], xyz[..., 1], xyz[..., 2])
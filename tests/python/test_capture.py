@@ -0,0 +1,64 @@
+import pytest
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../python')))
+import numpy as np
+cv2 = pytest.importorskip("cv2")
+pytest.importorskip("mss")
+pytest.importorskip("easyocr")
+from sdr_geolocation_lib.capture.capture import (
+    GpuFrameBuffer, calculate_ssim, calculate_ssim_gpu, cuda_available, downsample_gray
+)
+
+requires_cuda = pytest.mark.skipif(not cuda_available(), reason="no CUDA device")
+
+
+def make_frames(channels=4):
+    """A screen-like frame of flat panels and text-sized blocks, and a changed copy"""
+    rng = np.random.default_rng(0)
+    frame = np.full((480, 640, channels), 40, dtype=np.uint8)
+    for _ in range(100):
+        y, x = rng.integers(0, 460), rng.integers(0, 560)
+        frame[y:y + 12, x:x + 80, :3] = rng.integers(0, 256, 3)
+    changed = frame.copy()
+    changed[200:300, 250:400, :3] = 255
+    return frame, changed
+
+
+def test_calculate_ssim_identical_frames():
+    frame, _ = make_frames()
+    assert calculate_ssim(frame, frame) == pytest.approx(1.0)
+
+
+def test_calculate_ssim_detects_change():
+    frame, changed = make_frames()
+    assert calculate_ssim(frame, changed) < 0.95
+
+
+def test_calculate_ssim_accepts_downsampled_frames():
+    frame, changed = make_frames()
+    assert calculate_ssim(downsample_gray(frame), downsample_gray(changed)) == pytest.approx(
+        calculate_ssim(frame, changed))
+
+
+def test_calculate_ssim_flat_frames():
+    flat = np.full((480, 640, 4), 40, dtype=np.uint8)
+    assert calculate_ssim(flat, flat) == 1.0
+    assert calculate_ssim(flat, flat + 1) == 0.0
+
+
+@requires_cuda
+@pytest.mark.parametrize("channels", [3, 4])
+def test_calculate_ssim_gpu_matches_cpu(channels):
+    frame, changed = make_frames(channels)
+    buf = GpuFrameBuffer()
+    assert calculate_ssim_gpu(frame, changed, buf) == pytest.approx(calculate_ssim(frame, changed), abs=1e-4)
+    assert calculate_ssim_gpu(frame, frame, buf) == pytest.approx(1.0, abs=1e-4)
+
+
+@requires_cuda
+def test_calculate_ssim_gpu_grayscale_frames():
+    frame, changed = make_frames()
+    gray, gray_changed = (cv2.cvtColor(f, cv2.COLOR_BGRA2GRAY) for f in (frame, changed))
+    expected = calculate_ssim(downsample_gray(gray), downsample_gray(gray_changed))
+    assert calculate_ssim_gpu(gray, gray_changed, GpuFrameBuffer()) == pytest.approx(expected, abs=1e-4)
@@ -0,0 +1,134 @@
+import pytest
+import os
+import asyncio
+import json
+import importlib.util
+import numpy as np
+
+# The detector is a script with a hyphenated name, so it is loaded from its path
+for module in ("rtlsdr", "websockets", "requests", "scipy"):
+    pytest.importorskip(module)
+_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../python/python-fcc-detector.py'))
+_spec = importlib.util.spec_from_file_location("fcc_detector", _path)
+fcc = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(fcc)
+
+
+class FakeCollection:
+    def __init__(self):
+        self.batches = []
+
+    def insert_many(self, records, ordered=True):
+        self.batches.append(records)
+
+
+def test_violation_log_add_below_max_buffer():
+    async def run():
+        log = fcc.ViolationLog(FakeCollection(), max_buffer=5)
+        log.add(np.array([100.0, 200.0]), np.array([0.5, 0.6]), 1.0)
+        return log
+    log = asyncio.run(run())
+    assert log._pending == 2
+    assert not log._flush_requested.is_set()
+
+
+def test_violation_log_add_reaching_max_buffer_requests_flush():
+    async def run():
+        log = fcc.ViolationLog(FakeCollection(), max_buffer=3)
+        log.add(np.array([100.0, 200.0]), np.array([0.5, 0.6]), 1.0)
+        log.add(np.array([300.0]), np.array([0.7]), 2.0)
+        return log
+    assert asyncio.run(run())._flush_requested.is_set()
+
+
+def test_violation_log_flush_inserts_one_batch():
+    collection = FakeCollection()
+
+    async def run():
+        log = fcc.ViolationLog(collection)
+        log.add(np.array([100.0, 200.0]), np.array([0.5, 0.6]), 1.0)
+        log.add(np.array([300.0]), np.array([0.7]), 2.0, simulated=True)
+        await log.flush()
+        return log
+    log = asyncio.run(run())
+
+    assert len(collection.batches) == 1
+    records = collection.batches[0]
+    assert [r["frequency_khz"] for r in records] == [100.0, 200.0, 300.0]
+    assert [r["timestamp"] for r in records] == [1.0, 1.0, 2.0]
+    assert records[2]["frequency_mhz"] == pytest.approx(0.3)
+    assert records[2]["simulated"] is True
+    assert log._buffer == [] and log._pending == 0
+
+
+def test_violation_log_flush_empty_buffer():
+    collection = FakeCollection()
+    asyncio.run(fcc.ViolationLog(collection).flush())
+    assert collection.batches == []
+
+
+def test_violation_log_run_flushes_on_max_buffer_and_cancel():
+    collection = FakeCollection()
+
+    async def run():
+        # The interval is long enough that only max_buffer and cancel can flush
+        log = fcc.ViolationLog(collection, flush_interval=60.0, max_buffer=2)
+        task = asyncio.create_task(log.run())
+        log.add(np.array([100.0, 200.0]), np.array([0.5, 0.6]), 1.0)
+        for _ in range(100):
+            if collection.batches:
+                break
+            await asyncio.sleep(0.01)
+        assert len(collection.batches) == 1
+
+        # Cancelling the task flushes what is still buffered
+        log.add(np.array([300.0]), np.array([0.7]), 2.0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    asyncio.run(run())
+
+    assert [len(batch) for batch in collection.batches] == [2, 1]
+
+
+def decode_spectrum_frame(frame):
+    """Decode a spectrum frame at the fixed offsets the JavaScript clients read"""
+    magic, bins, violations_length, reserved, start_hz, step_hz, timestamp = \
+        fcc.SPECTRUM_FRAME_HEADER.unpack_from(frame)
+    assert magic == fcc.SPECTRUM_FRAME_MAGIC
+    assert reserved == 0
+    header_bytes = fcc.SPECTRUM_FRAME_HEADER.size
+    amplitudes = np.frombuffer(frame, dtype='<f4', count=bins, offset=header_bytes)
+    violations_bytes = frame[header_bytes + 4 * bins:]
+    assert len(violations_bytes) == violations_length
+    return start_hz, step_hz, timestamp, amplitudes, violations_bytes
+
+
+def test_spectrum_frame_header_layout():
+    # frontend/*.js hard-code a 40 byte header with float64 fields at 16, 24 and 32
+    assert fcc.SPECTRUM_FRAME_HEADER.size == 40
+    frame = fcc.encode_spectrum_frame(88.0e6, 1000.5, np.zeros(4), [], 1700000000.25)
+    assert frame[:4] == b"SPEC"
+    assert np.frombuffer(frame, dtype='<u4', count=2, offset=4).tolist() == [4, 0]
+    assert np.frombuffer(frame, dtype='<f8', count=3, offset=16).tolist() == [88.0e6, 1000.5, 1700000000.25]
+
+
+def test_spectrum_frame_without_violations():
+    amplitudes = np.linspace(0.0, 1.0, 2048)
+    frame = fcc.encode_spectrum_frame(88.0e6, 1000.5, amplitudes, [], 1700000000.25)
+    start_hz, step_hz, timestamp, decoded, violations_bytes = decode_spectrum_frame(frame)
+
+    assert (start_hz, step_hz, timestamp) == (88.0e6, 1000.5, 1700000000.25)
+    np.testing.assert_array_equal(decoded, amplitudes.astype(np.float32))
+    assert violations_bytes == b""
+    assert len(frame) == 40 + 4 * 2048
+
+
+def test_spectrum_frame_with_violations():
+    amplitudes = np.array([0.1, 0.9, 0.2], dtype=np.float32)
+    violations = fcc.violation_records(np.array([100.0, 250.5]), np.array([0.9, 0.4]), 1700000000.25)
+    frame = fcc.encode_spectrum_frame(99.0e6, 500.0, amplitudes, violations, 1700000000.25)
+    _, _, _, decoded, violations_bytes = decode_spectrum_frame(frame)
+
+    np.testing.assert_array_equal(decoded, amplitudes)
+    assert json.loads(violations_bytes.decode("utf-8")) == violations
@@ -0,0 +1,176 @@
+import pytest
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../python')))
+import numpy as np
+from scipy.optimize import OptimizeResult
+
+# The package imports its remote/capture modules, so skip without their dependencies
+solver = pytest.importorskip("sdr_geolocation_lib.algorithms.solver")
+tdoa = pytest.importorskip("sdr_geolocation_lib.algorithms.tdoa")
+rssi = pytest.importorskip("sdr_geolocation_lib.algorithms.rssi")
+
+# ENU receiver positions in meters, reference receiver first. One is on a
+# mountain: with all of them near the ground, height is nearly mirror-ambiguous.
+RECEIVERS = np.array([
+    [0.0, 0.0, 0.0],
+    [10000.0, 0.0, 30.0],
+    [0.0, 10000.0, 50.0],
+    [10000.0, 10000.0, 80.0],
+    [5000.0, -3000.0, 2500.0],
+])
+TRANSMITTER = np.array([3000.0, 4000.0, 100.0])
+
+
+def tdoa_problem(positions=RECEIVERS, transmitter=TRANSMITTER):
+    distances = np.linalg.norm(positions - transmitter, axis=1)
+    range_diffs = np.ascontiguousarray(distances[1:] - distances[0])
+    return (lambda x: tdoa._tdoa_residuals(x, positions, range_diffs),
+            lambda x: tdoa._tdoa_jacobian(x, positions))
+
+
+def rssi_problem(positions=RECEIVERS, transmitter=TRANSMITTER):
+    power = 1.0 / np.sum((positions - transmitter) ** 2, axis=1)
+    # Weights scale the residuals to order one, as SNR weighting would
+    weights = 1.0 / power
+    return (lambda x: rssi._rssi_residuals(x, positions, power, weights),
+            lambda x: rssi._rssi_jacobian(x, positions, weights))
+
+
+@pytest.mark.parametrize("problem", [tdoa_problem, rssi_problem])
+def test_levenberg_marquardt_converges_to_transmitter(problem):
+    residuals, jacobian = problem()
+    result = solver.levenberg_marquardt(residuals, jacobian, RECEIVERS.mean(axis=0))
+    assert result.success
+    np.testing.assert_allclose(result.x, TRANSMITTER, atol=1e-3)
+
+
+@pytest.mark.parametrize("starts", [1, 8])
+def test_solve_multistart_converges_to_transmitter(starts):
+    residuals, jacobian = tdoa_problem()
+    result = solver.solve_multistart(residuals, jacobian, RECEIVERS, starts=starts,
+                                     initial_guess=RECEIVERS.mean(axis=0))
+    assert result.success
+    np.testing.assert_allclose(result.x, TRANSMITTER, atol=1e-3)
+
+
+def failed_levenberg_marquardt(residuals, jacobian, x0, **kwargs):
+    return OptimizeResult(x=np.array(x0, dtype=float), success=False)
+
+
+def test_solve_multistart_falls_back_to_trf(monkeypatch):
+    calls = []
+
+    def least_squares(*args, **kwargs):
+        calls.append(kwargs.get("method"))
+        return solver_least_squares(*args, **kwargs)
+    solver_least_squares = solver.least_squares
+    monkeypatch.setattr(solver, "levenberg_marquardt", failed_levenberg_marquardt)
+    monkeypatch.setattr(solver, "least_squares", least_squares)
+
+    residuals, jacobian = tdoa_problem()
+    result = solver.solve_multistart(residuals, jacobian, RECEIVERS, initial_guess=RECEIVERS.mean(axis=0))
+    assert calls == ["trf"]
+    assert result.success
+    np.testing.assert_allclose(result.x, TRANSMITTER, atol=1e-3)
+
+
+def test_solve_multistart_falls_back_to_initial_guess(monkeypatch):
+    # Far outside the network, so a random candidate always scores better
+    initial_guess = np.array([1e6, 1e6, 0.0])
+    starts = []
+
+    def least_squares(residuals, start, **kwargs):
+        starts.append(np.array(start))
+        return OptimizeResult(x=np.array(start), success=np.array_equal(start, initial_guess))
+    monkeypatch.setattr(solver, "levenberg_marquardt", failed_levenberg_marquardt)
+    monkeypatch.setattr(solver, "least_squares", least_squares)
+
+    residuals, jacobian = tdoa_problem()
+    result = solver.solve_multistart(residuals, jacobian, RECEIVERS, starts=4, initial_guess=initial_guess)
+    assert len(starts) == 2
+    assert not np.array_equal(starts[0], initial_guess)
+    np.testing.assert_array_equal(starts[1], initial_guess)
+    assert result.success
+
+
+def test_solve_multistart_no_retry_from_failed_initial_guess(monkeypatch):
+    starts = []
+
+    def least_squares(residuals, start, **kwargs):
+        starts.append(np.array(start))
+        return OptimizeResult(x=np.array(start), success=False)
+    monkeypatch.setattr(solver, "levenberg_marquardt", failed_levenberg_marquardt)
+    monkeypatch.setattr(solver, "least_squares", least_squares)
+
+    residuals, jacobian = tdoa_problem()
+    result = solver.solve_multistart(residuals, jacobian, RECEIVERS, initial_guess=RECEIVERS.mean(axis=0))
+    assert len(starts) == 1
+    assert not result.success
+
+
+# Receivers and transmitter on one plane, where the horizontal closed-form seeds are exact
+PLANAR_RECEIVERS = RECEIVERS * [1.0, 1.0, 0.0]
+PLANAR_TRANSMITTER = TRANSMITTER * [1.0, 1.0, 0.0]
+COLLINEAR_RECEIVERS = np.array([[0.0, 0.0, 0.0], [2000.0, 1000.0, 0.0], [6000.0, 3000.0, 0.0], [10000.0, 5000.0, 0.0]])
+
+
+def range_diffs_to(positions, transmitter):
+    distances = np.linalg.norm(positions - transmitter, axis=1)
+    return distances[1:] - distances[0]
+
+
+def ranges_to(positions, transmitter):
+    return np.linalg.norm(positions - transmitter, axis=1)
+
+
+@pytest.mark.parametrize("count", [4, 5])
+def test_tdoa_linear_guess_exact_for_planar_geometry(count):
+    positions = PLANAR_RECEIVERS[:count]
+    guess = tdoa._linear_guess(positions, range_diffs_to(positions, PLANAR_TRANSMITTER))
+    np.testing.assert_allclose(guess, PLANAR_TRANSMITTER, atol=1e-6)
+
+
+def test_tdoa_linear_guess_keeps_reference_height():
+    guess = tdoa._linear_guess(RECEIVERS, range_diffs_to(RECEIVERS, TRANSMITTER))
+    assert guess[2] == RECEIVERS[0, 2]
+
+
+def test_tdoa_linear_guess_too_few_receivers():
+    positions = PLANAR_RECEIVERS[:3]
+    assert tdoa._linear_guess(positions, range_diffs_to(positions, PLANAR_TRANSMITTER)) is None
+
+
+def test_tdoa_linear_guess_collinear_receivers():
+    range_diffs = range_diffs_to(COLLINEAR_RECEIVERS, PLANAR_TRANSMITTER)
+    assert tdoa._linear_guess(COLLINEAR_RECEIVERS, range_diffs) is None
+
+
+def test_tdoa_linear_guess_rank_deficient():
+    # Receivers stacked above each other leave no horizontal baseline at all
+    positions = np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 100.0], [0.0, 0.0, 200.0], [0.0, 0.0, 300.0]])
+    assert tdoa._linear_guess(positions, range_diffs_to(positions, PLANAR_TRANSMITTER)) is None
+
+
+@pytest.mark.parametrize("count", [3, 5])
+def test_rssi_linear_guess_exact_for_planar_geometry(count):
+    positions = PLANAR_RECEIVERS[:count]
+    guess = rssi._linear_guess(positions, ranges_to(positions, PLANAR_TRANSMITTER))
+    np.testing.assert_allclose(guess, PLANAR_TRANSMITTER, atol=1e-6)
+
+
+def test_rssi_linear_guess_too_few_receivers():
+    positions = PLANAR_RECEIVERS[:2]
+    assert rssi._linear_guess(positions, ranges_to(positions, PLANAR_TRANSMITTER)) is None
+
+
+def test_rssi_linear_guess_collinear_receivers():
+    ranges = ranges_to(COLLINEAR_RECEIVERS, PLANAR_TRANSMITTER)
+    assert rssi._linear_guess(COLLINEAR_RECEIVERS, ranges) is None
+
+
+def test_rssi_linear_guess_non_finite_ranges():
+    # A zero measured power implies an infinite range
+    ranges = ranges_to(PLANAR_RECEIVERS, PLANAR_TRANSMITTER)
+    ranges[1] = np.inf
+    assert rssi._linear_guess(PLANAR_RECEIVERS, ranges) is None